@@ -1,21 +1,20 @@
 # coding: utf-8
-from collections import OrderedDict
 
 
 def pformat_dict(data, separator='  '):
-    column_widths = OrderedDict([(k, max([len(k)] +
-                                         [len(str(v)) for v in v]))
-                                for k, v in data.items()])
+    keys = list(data.keys())
+    columns = list(data.values())
+    column_widths = [max([len(k)] + [len(str(v)) for v in column])
+                     for k, column in zip(keys, columns)]
+    # Bound `format` method of right-aligned format string for each column.
+    formats = [('{:>%ds}' % column_width).format
+               for column_width in column_widths]
 
-    header = separator.join([('{:>%ds}' % (column_width)).format(value)
-                             for value, column_width in
-                             zip(list(data.keys()), list(column_widths.values()))])
-    hbar = separator.join(['-' * column_width
-                           for value, column_width in
-                           zip(list(data.keys()), list(column_widths.values()))])
-    rows = [separator.join([('{:>%ds}' % (column_width)).format(value)
-                            for value, column_width in
-                            zip(row, list(column_widths.values()))])
-            for row in zip(*list(data.values()))]
+    header = separator.join(format_i(k) for format_i, k in zip(formats, keys))
+    hbar = separator.join('-' * column_width
+                          for column_width in column_widths)
+    rows = (separator.join(format_i(value)
+                           for format_i, value in zip(formats, row))
+            for row in zip(*columns))
 
-    return '\n'.join([header, hbar] + rows)
+    return '\n'.join([header, hbar] + list(rows))
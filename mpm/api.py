@@ -2,59 +2,897 @@
 '''
 See https://github.com/wheeler-microfluidics/microdrop/issues/216
 '''
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 import bz2
+import functools
+import hashlib
 import importlib
-import itertools as it
 import logging
 import json
+import os
 import platform
-import re
+import stat
+import subprocess as sp
 import sys
-import types
+import time
 
-import conda_helpers as ch
 import path_helpers as ph
-import requests
-import yaml
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Use fastest available JSON implementation for (potentially multi-megabyte)
+# Conda output.  Note that `_json_dumps()` always returns `bytes`, and is
+# compact (i.e., no indentation) unless `pretty=True`, since files written by
+# this module are usually only read back by this module.
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj, pretty=False):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if pretty else 0)
+except ImportError:
+    try:
+        import ujson
+
+        _json_loads = ujson.loads
+
+        def _json_dumps(obj, pretty=False):
+            return ujson.dumps(obj, indent=2 if pretty else 0).encode('utf8')
+    except ImportError:
+        _json_loads = json.loads
+
+        def _json_dumps(obj, pretty=False):
+            if pretty:
+                return json.dumps(obj, indent=2).encode('utf8')
+            return json.dumps(obj, separators=(',', ':')).encode('utf8')
 
 
 logger = logging.getLogger(__name__)
 
 
-MICRODROP_CONDA_ETC = ch.conda_prefix().joinpath('etc', 'microdrop')
-MICRODROP_CONDA_SHARE = ch.conda_prefix().joinpath('share', 'microdrop')
-MICRODROP_CONDA_ACTIONS = MICRODROP_CONDA_ETC.joinpath('actions')
-MICRODROP_CONDA_PLUGINS = MICRODROP_CONDA_ETC.joinpath('plugins')
+# Paths relative to Conda prefix.
+#
+# Each path is exposed as a module attribute, e.g., `MICRODROP_CONDA_ETC`, but
+# is only resolved on first access (see `_conda_path()`) to avoid importing
+# `conda_helpers` and querying the Conda prefix at import time.
+_CONDA_PATHS = {'MICRODROP_CONDA_ETC': ('etc', 'microdrop'),
+                'MICRODROP_CONDA_SHARE': ('share', 'microdrop'),
+                'MICRODROP_CONDA_ACTIONS': ('etc', 'microdrop', 'actions'),
+                'MICRODROP_CONDA_PLUGINS': ('etc', 'microdrop', 'plugins'),
+                'MICRODROP_CONDA_CACHE': ('etc', 'microdrop', 'cache'),
+                # Conda-managed plugins.
+                'MICRODROP_PLUGINS_AVAILABLE': ('share', 'microdrop',
+                                                'plugins', 'available'),
+                # User-managed plugins.
+                'MICRODROP_ETC_PLUGINS_AVAILABLE': ('etc', 'microdrop',
+                                                    'plugins', 'available'),
+                'MICRODROP_PLUGINS_ENABLED': ('etc', 'microdrop', 'plugins',
+                                              'enabled')}
+
+#: Default number of seconds for which a plugin channel revision probe is
+#: reused by :func:`available_packages` (i.e., without querying the server).
+AVAILABLE_CACHE_TTL = 600
+
+# Extension of compressed cache files, i.e., `zstd` if available, otherwise
+# `bz2`.  Note that action files are always compressed using `bz2` (see
+# `_save_action()`).
+_COMPRESSED_EXT = '.zst' if zstandard is not None else '.bz2'
+
+_IS_WINDOWS = platform.system() == 'Windows'
+
+# In-process cache of `installed_plugins()` results, keyed by
+# `(only_conda, fields, <modified time of plugins "available" directory>)`.
+_INSTALLED_CACHE = {}
+
+# In-process cache of Conda environment revisions, keyed by
+# `(<modified time>, <size>)` of Conda environment history file.
+_REVISIONS_CACHE = {}
+
+# In-process cache of `available_packages()` results, keyed by channel
+# revision (see `_available_cache_key()`).
+_AVAIL_CACHE = {}
+
+# In-process cache of channel revision probes, keyed by search arguments and
+# Conda environment state, each mapped to `(<probe time>, <channel
+# revision>)`.
+_AVAIL_PROBES = {}
 
 
 __all__ = ['available_packages', 'install', 'rollback', 'uninstall',
            'enable_plugin', 'disable_plugin', 'update', 'MICRODROP_CONDA_ETC',
            'MICRODROP_CONDA_SHARE', 'MICRODROP_CONDA_ACTIONS',
-           'MICRODROP_CONDA_PLUGINS']
+           'MICRODROP_CONDA_PLUGINS', 'MICRODROP_CONDA_CACHE',
+           'MICRODROP_PLUGINS_AVAILABLE', 'MICRODROP_ETC_PLUGINS_AVAILABLE',
+           'MICRODROP_PLUGINS_ENABLED']
 
 
-def _islinklike(dir_path):
+@functools.lru_cache(maxsize=1)
+def _conda_prefix():
+    '''
+    Returns
+    -------
+    path_helpers.path
+        Prefix of active Conda environment, resolved once per process.
+    '''
+    import conda_helpers as ch
+
+    return ch.conda_prefix()
+
+
+@functools.lru_cache(maxsize=None)
+def _conda_path(name, *parts):
     '''
     Parameters
     ----------
-    dir_path : str
-        Directory path.
+    name : str
+        Name of path constant, e.g., ``'MICRODROP_CONDA_ETC'``.
+    *parts : str
+        Path components to join to path constant.
+
+    Returns
+    -------
+    path_helpers.path
+        Path in Conda prefix.
+    '''
+    return _conda_prefix().joinpath(*(_CONDA_PATHS[name] + parts))
+
+
+def __getattr__(name):
+    # Resolve `MICRODROP_CONDA_*` path constants on first access (PEP 562).
+    if name in _CONDA_PATHS:
+        return _conda_path(name)
+    raise AttributeError('module {!r} has no attribute {!r}'
+                         .format(__name__, name))
+
+
+@functools.lru_cache(maxsize=1)
+def _yaml_loader():
+    '''
+    Returns
+    -------
+    type
+        ``libyaml``-backed safe YAML loader, if available.  Otherwise, pure
+        Python safe YAML loader.
+    '''
+    try:
+        from yaml import CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeLoader as Loader
+    return Loader
+
+
+if _IS_WINDOWS:
+    def _make_link(source, link_name):
+        # Use junction, since creating a symbolic link requires elevated
+        # privileges on Windows.
+        ph.path(source).junction(link_name)
+else:
+    _make_link = os.symlink
+
+
+def _entry_islinklike(entry):
+    '''
+    Parameters
+    ----------
+    entry : os.DirEntry
+        Directory entry, e.g., from :func:`os.scandir`.
 
     Returns
     -------
     bool
-        ``True`` if :data:`dir_path` is a link *or* junction.
+        ``True`` if :data:`entry` is a link *or* junction.
+
+        Uses file info cached by :func:`os.scandir` (including file attributes
+        on Windows), i.e., without querying the file system again.
     '''
-    dir_path = ph.path(dir_path)
-    if platform.system() == 'Windows':
-        if dir_path.isjunction():
-            return True
-    elif dir_path.islink():
+    if entry.is_symlink():
         return True
+    elif _IS_WINDOWS:
+        # Junctions are reparse points.
+        return bool(entry.stat(follow_symlinks=False).st_file_attributes &
+                    stat.FILE_ATTRIBUTE_REPARSE_POINT)
     return False
 
 
-def _save_action(extra_context=None):
+def _plugin_dir_names(dir_path):
+    '''
+    Parameters
+    ----------
+    dir_path : str
+        Directory path.
+
+    Returns
+    -------
+    set
+        Names of **real** sub-directories (i.e., not links or junctions) of
+        :data:`dir_path`.  Empty if :data:`dir_path` does not exist.
+    '''
+    if not os.path.isdir(dir_path):
+        return set()
+    with os.scandir(dir_path) as entries:
+        return set(entry_i.name for entry_i in entries
+                   if entry_i.is_dir(follow_symlinks=False) and
+                   not _entry_islinklike(entry_i))
+
+
+def _plugin_entry_names(dir_path):
+    '''
+    Parameters
+    ----------
+    dir_path : str
+        Directory path.
+
+    Returns
+    -------
+    set
+        Names of sub-directories *and* links/junctions (including broken
+        links) in :data:`dir_path`.  Empty if :data:`dir_path` does not exist.
+    '''
+    if not os.path.isdir(dir_path):
+        return set()
+    with os.scandir(dir_path) as entries:
+        return set(entry_i.name for entry_i in entries
+                   if entry_i.is_dir() or _entry_islinklike(entry_i))
+
+
+def _plugin_properties(plugin_path, fields=None):
+    '''
+    Read plugin package info from ``properties.yml`` file.
+
+    Parameters
+    ----------
+    plugin_path : str
+        Plugin directory path.
+    fields : set, optional
+        Names of properties to return.
+
+        By default, all properties are returned, including ``path``.
+
+    Returns
+    -------
+    dict or None
+        Plugin properties, including ``path`` (real path of plugin
+        directory), or ``None`` if properties could not be read.
+    '''
+    import yaml
+
+    plugin_path = ph.path(plugin_path)
+    properties_path = plugin_path.joinpath('properties.yml')
+    try:
+        with properties_path.open('r') as input_:
+            properties = yaml.load(input_, Loader=_yaml_loader())
+    except:
+        logger.info('[warning] Could not read package info: `%s`',
+                    properties_path, exc_info=True)
+        return None
+    if fields is not None:
+        properties = {k: properties[k] for k in fields if k in properties}
+        if 'path' not in fields:
+            # Skip resolving real path of plugin directory.
+            return properties
+    properties['path'] = plugin_path.realpath()
+    return properties
+
+
+def _clear_caches():
+    '''
+    Clear cached information about the Conda environment.
+
+    Must be called whenever the Conda environment is modified.
+    '''
+    _INSTALLED_CACHE.clear()
+    _cached_installed_packages.cache_clear()
+
+
+def _installed_packages(package_names):
+    '''
+    Look up Conda packages installed in the Conda environment.
+
+    Results are cached to share a single ``conda`` query between, e.g.,
+    :func:`installed_plugins` and :func:`enabled_plugins`, until the Conda
+    environment is modified (including by another process).
+
+    Parameters
+    ----------
+    package_names : frozenset
+        Conda package names.
+
+    Returns
+    -------
+    tuple
+        Installed package info (see :func:`conda_helpers.package_version`)
+        for each package in :data:`package_names` that is installed.
+    '''
+    conda_meta_mtime = os.stat(_conda_prefix()
+                               .joinpath('conda-meta')).st_mtime_ns
+    return _cached_installed_packages(package_names, conda_meta_mtime)
+
+
+@functools.lru_cache(maxsize=4)
+def _cached_installed_packages(package_names, conda_meta_mtime):
+    '''
+    Parameters
+    ----------
+    package_names : frozenset
+        Conda package names.
+    conda_meta_mtime : int
+        Modified time (in nanoseconds) of ``conda-meta`` directory in Conda
+        environment, i.e., changes whenever packages are linked or unlinked.
+
+    Returns
+    -------
+    tuple
+        Installed package info (see :func:`conda_helpers.package_version`)
+        for each package in :data:`package_names` that is installed.
+    '''
+    if not package_names:
+        # Nothing to look up, so skip the `conda` query.
+        return ()
+
+    import conda_helpers as ch
+
+    try:
+        return tuple(ch.package_version(sorted(package_names), verbose=False))
+    except ch.PackageNotFound as exception:
+        # At least one specified package name did not correspond to an
+        # installed Conda package.
+        logger.warning(str(exception))
+        return tuple(exception.available)
+
+
+def _pinned_specs_installed(specs):
+    '''
+    Parameters
+    ----------
+    specs : list
+        Conda package specs, e.g., ``['foo ==1.0.5', 'bar==2.1']``.
+
+    Returns
+    -------
+    bool
+        ``True`` if each spec pins an exact version (i.e., ``==``) and that
+        version is installed in the Conda environment.
+
+        Specs without an exact version (e.g., ``foo``, ``foo >=1.0``) always
+        return ``False``, since Conda may resolve them to a newer version.
+    '''
+    import conda_helpers as ch
+
+    pinned_versions = {}
+    for spec_i in specs:
+        name_i, operator_i, version_i = spec_i.partition('==')
+        name_i, version_i = name_i.strip(), version_i.strip()
+        if (not operator_i or not name_i or not version_i or
+                any(c in name_i + version_i for c in ' <>=!,|*')):
+            return False
+        pinned_versions[name_i] = version_i
+
+    # Query installed versions directly (i.e., *not* through cached
+    # `_installed_packages()`) in case the Conda environment was modified by
+    # another process.
+    try:
+        package_infos = ch.package_version(sorted(pinned_versions),
+                                           verbose=False)
+    except ch.PackageNotFound:
+        return False
+    installed_versions = {package_i['name']: package_i['version']
+                          for package_i in package_infos}
+    return all(installed_versions.get(name_i) == version_i
+               for name_i, version_i in pinned_versions.items())
+
+
+def _last_json_chunk(output):
+    '''
+    Parameters
+    ----------
+    output : str
+        Conda JSON output, potentially containing multiple null-separated
+        JSON chunks (e.g., progress messages).
+
+    Returns
+    -------
+    str
+        Last null-separated chunk of :data:`output`.
+    '''
+    return output[output.rfind('\x00') + 1:]
+
+
+def _conda_exec_progress(conda_args, progress_callback):
+    '''
+    Run ``conda`` command with ``--json`` output, reporting progress messages
+    as they are written (rather than once the command has finished).
+
+    .. versionadded:: 0.26
+
+    Parameters
+    ----------
+    conda_args : list
+        Arguments to ``conda`` command (including ``--json``).
+    progress_callback : callable
+        Called with ``(fraction, message)`` for each null-separated progress
+        chunk in Conda output, e.g., ``{"fetch": "foo-1.0-py_0", "progress":
+        0.5, ...}``.
+
+    Returns
+    -------
+    dict
+        Decoded final JSON chunk of Conda output.
+
+    Raises
+    ------
+    RuntimeError
+        If ``conda`` command fails (error details, e.g.,
+        ``CondaHTTPError``, are included in the message).
+    '''
+    process = sp.Popen([_conda_executable()] + list(conda_args),
+                       stdout=sp.PIPE)
+    pending = b''
+    try:
+        for data in iter(lambda: process.stdout.read1(1 << 16), b''):
+            chunks = (pending + data).split(b'\x00')
+            # Last chunk may be incomplete.
+            pending = chunks.pop()
+            for chunk_i in chunks:
+                try:
+                    progress_i = _json_loads(chunk_i)
+                except ValueError:
+                    continue
+                if isinstance(progress_i, dict) and 'progress' in progress_i:
+                    progress_callback(float(progress_i['progress']),
+                                      progress_i.get('fetch', ''))
+    finally:
+        process.stdout.close()
+        returncode = process.wait()
+    if returncode != 0:
+        raise RuntimeError('Error executing Conda command (return code == {}): '
+                           '{}'.format(returncode, pending.decode('utf8')))
+    return _json_loads(pending)
+
+
+def _read_compressed(file_path):
+    '''
+    Read contents of file, decompressing according to file extension.
+
+    Parameters
+    ----------
+    file_path : str
+        File path.  Files ending in ``.zst`` and ``.bz2`` are decompressed
+        using ``zstd`` and ``bz2``, respectively.
+
+    Returns
+    -------
+    bytes
+        Decompressed file contents.
+    '''
+    file_path = ph.path(file_path)
+    ext = file_path.ext.lower()
+    data = file_path.bytes()
+    if ext == '.zst':
+        if zstandard is None:
+            raise IOError('`zstandard` package is required to read `{}`'
+                          .format(file_path))
+        return zstandard.ZstdDecompressor().decompress(data)
+    elif ext == '.bz2':
+        return bz2.decompress(data)
+    return data
+
+
+def _write_compressed(file_path, data):
+    '''
+    Write data to file, compressing according to file extension.
+
+    The file is replaced atomically, i.e., concurrent readers never see a
+    partially written file.
+
+    Parameters
+    ----------
+    file_path : str
+        File path.  Files ending in ``.zst`` and ``.bz2`` are compressed using
+        ``zstd`` and ``bz2``, respectively.
+    data : bytes
+        Data to write.
+    '''
+    file_path = ph.path(file_path)
+    ext = file_path.ext.lower()
+    if ext == '.zst':
+        data = zstandard.ZstdCompressor(level=3).compress(data)
+    elif ext == '.bz2':
+        # Files are small and rarely read, so favour write speed over ratio.
+        data = bz2.compress(data, compresslevel=1)
+    # Write to temporary file in same directory, then atomically replace.
+    #
+    # Note that the temporary file name starts with `.`, so it is never
+    # mistaken for an action revision file (see `_action_rev()`), e.g., if
+    # left behind by a crash.
+    temp_path = file_path.parent.joinpath('.{}.{}.tmp'
+                                          .format(file_path.name,
+                                                  os.getpid()))
+    try:
+        output = open(temp_path, 'wb')
+    except FileNotFoundError:
+        # Only create parent directory if it does not exist (i.e., skip
+        # checking for it on every write).
+        file_path.parent.makedirs_p()
+        output = open(temp_path, 'wb')
+    try:
+        with output:
+            output.write(data)
+        os.replace(temp_path, file_path)
+    except:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
+
+
+def _channel_urls(args):
+    '''
+    Parameters
+    ----------
+    args : list
+        Extra Conda command-line arguments.
+
+    Returns
+    -------
+    list or None
+        URL of each channel subdirectory searched by Conda (e.g.,
+        ``https://conda.anaconda.org/microdrop-plugins/win-64``).
+
+        Searched channels are each channel explicitly specified in
+        :data:`args` (using ``-c``/``--channel``) followed by each channel in
+        the Conda configuration (unless ``--override-channels`` is
+        specified).  Searched subdirectories are the platform subdirectory
+        (i.e., ``--subdir``/``--platform`` if specified) and ``noarch``.
+
+        ``None`` if the searched channels could not be determined, e.g., if
+        the ``conda`` package is not importable.
+    '''
+    try:
+        from conda.base.context import context
+        from conda.models.channel import Channel
+    except ImportError:
+        return None
+
+    args = list(args)
+    channels = []
+    subdirs = tuple(context.subdirs)
+    for i, arg_i in enumerate(args):
+        if arg_i in ('-c', '--channel') and i + 1 < len(args):
+            channels.append(args[i + 1])
+        elif arg_i.startswith('--channel='):
+            channels.append(arg_i.split('=', 1)[1])
+        elif arg_i in ('--subdir', '--platform') and i + 1 < len(args):
+            subdirs = (args[i + 1], 'noarch')
+        elif arg_i.startswith(('--subdir=', '--platform=')):
+            subdirs = (arg_i.split('=', 1)[1], 'noarch')
+    if '--override-channels' not in args:
+        channels.extend(context.channels)
+    if not channels:
+        return None
+    channel_urls = []
+    for channel_i in channels:
+        # Expand multi-channels (e.g., `defaults`) to the URLs of each member
+        # channel.
+        for url_j in Channel(channel_i).urls(subdirs=subdirs):
+            url_j = url_j.rstrip('/')
+            if url_j not in channel_urls:
+                channel_urls.append(url_j)
+    return channel_urls or None
+
+
+@functools.lru_cache(maxsize=1)
+def _http_session():
+    '''
+    Returns
+    -------
+    requests.Session
+        HTTP session shared by all requests made by this module, i.e., reusing
+        connections (and TLS handshakes) across calls.
+    '''
+    import atexit
+
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    # Do not retry failed requests (e.g., when offline), since callers fall
+    # back gracefully if a request fails.
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=0)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    atexit.register(session.close)
+    return session
+
+
+def _available_cache_key(args):
+    '''
+    Compute key identifying current revision of plugin channel(s).
+
+    The key is a hash of:
+
+     - :data:`args`;
+     - the ``ETag`` (or ``Last-Modified``) header of the repodata of each
+       searched channel subdirectory, i.e., platform *and* ``noarch`` (see
+       :func:`_channel_urls`); and
+     - the modified time of the Conda environment history (since ``conda
+       search`` output flags installed packages).
+
+    Parameters
+    ----------
+    args : list
+        Extra arguments to pass to Conda ``search`` command.
+
+    Returns
+    -------
+    str or None
+        Cache key, or ``None`` if the searched channels, or the revision of
+        at least one channel, could not be determined.
+    '''
+    session = _http_session()
+
+    def _channel_revision(channel_url):
+        response = session.head(channel_url + '/repodata.json',
+                                allow_redirects=True, timeout=5)
+        response.raise_for_status()
+        return (response.headers.get('ETag') or
+                response.headers.get('Last-Modified'))
+
+    channel_urls = _channel_urls(args)
+    if channel_urls is None:
+        return None
+    elif len(channel_urls) > 1:
+        # Probe channel subdirectories concurrently (sharing pooled session
+        # connections).
+        executor = ThreadPoolExecutor(max_workers=min(8, len(channel_urls)))
+        with executor:
+            revisions = list(executor.map(_channel_revision, channel_urls))
+    else:
+        revisions = list(map(_channel_revision, channel_urls))
+    if not all(revisions):
+        return None
+    return _digest([list(args), revisions, _history_mtime()])
+
+
+def _history_mtime():
+    '''
+    Returns
+    -------
+    float or None
+        Modified time of Conda environment history file, or ``None`` if the
+        history file does not exist.
+    '''
+    history_path = _conda_prefix().joinpath('conda-meta', 'history')
+    return history_path.getmtime() if history_path.isfile() else None
+
+
+def _digest(obj):
+    '''
+    Parameters
+    ----------
+    obj : object
+        JSON-serializable object.
+
+    Returns
+    -------
+    str
+        Hex digest of JSON-encoded object.
+    '''
+    return hashlib.blake2b(json.dumps(obj).encode('utf8'),
+                           digest_size=16).hexdigest()
+
+
+@functools.lru_cache(maxsize=1)
+def _conda_executable():
+    '''
+    Returns
+    -------
+    str
+        Path to ``conda`` executable, resolved once per process.
+
+        The ``CONDA_EXE`` environment variable (set by ``conda activate``) is
+        used if it refers to an existing file.  Otherwise, fall back to
+        :func:`conda_helpers.conda_executable`.
+    '''
+    conda_exe = os.environ.get('CONDA_EXE')
+    if conda_exe and os.path.isfile(conda_exe):
+        return conda_exe
+    import conda_helpers as ch
+
+    return ch.conda_executable()
+
+
+def _iter_revisions():
+    '''
+    Iterate through revisions of active Conda environment.
+
+    If the ``conda`` package is importable, the Conda environment history is
+    read in-process (i.e., without launching a ``conda`` process).
+
+    Otherwise, if ``ijson`` is available, the JSON output of ``conda list
+    --revisions`` is parsed incrementally as it is read from the ``conda``
+    process, i.e., without buffering the entire output.
+
+    Yields
+    ------
+    dict
+        Revision (from JSON ``conda list --revisions`` output), oldest first.
+
+    Raises
+    ------
+    RuntimeError
+        If ``conda`` command fails.
+    '''
+    import conda_helpers as ch
+
+    try:
+        from conda.history import History
+    except ImportError:
+        pass
+    else:
+        history = History(_conda_prefix())
+        if os.path.isfile(history.path):
+            # Same revision objects as output by `conda list --revisions
+            # --json`.
+            for revision_i in history.object_log():
+                yield revision_i
+            return
+
+    if ijson is None:
+        revisions_js = ch.conda_exec('list', '--revisions', '--json',
+                                     verbose=False)
+        for revision_i in _json_loads(revisions_js):
+            yield revision_i
+        return
+
+    process = sp.Popen([_conda_executable(), 'list', '--revisions',
+                        '--json'], stdout=sp.PIPE)
+    try:
+        for revision_i in ijson.items(process.stdout, 'item'):
+            yield revision_i
+    finally:
+        process.stdout.close()
+        returncode = process.wait()
+    if returncode != 0:
+        raise RuntimeError('Error listing Conda environment revisions (return '
+                           'code == {})'.format(returncode))
+
+
+def _revisions():
+    '''
+    Returns
+    -------
+    list
+        Revisions of active Conda environment (see :func:`_iter_revisions`),
+        oldest first.
+
+        Results are cached until the Conda environment history file (i.e.,
+        ``<conda prefix>/conda-meta/history``) is modified.
+    '''
+    history_path = _conda_prefix().joinpath('conda-meta', 'history')
+    try:
+        # History file is append-only, so size changes with each revision,
+        # even if modified time resolution is coarse.
+        history_stat = os.stat(history_path)
+        cache_key = (history_stat.st_mtime_ns, history_stat.st_size)
+    except OSError:
+        cache_key = None
+    if cache_key is not None and cache_key in _REVISIONS_CACHE:
+        return list(_REVISIONS_CACHE[cache_key])
+
+    revisions = list(_iter_revisions())
+    if cache_key is not None:
+        # Only the most recent environment state is kept.
+        _REVISIONS_CACHE.clear()
+        _REVISIONS_CACHE[cache_key] = revisions
+    return list(revisions)
+
+
+def _search_plugin_packages(args):
+    '''
+    Search for Conda packages beginning with ``microdrop.`` prefix.
+
+    If no extra search arguments are specified and the ``conda`` package is
+    importable, query the Conda API in-process.  Otherwise, run ``conda
+    search``.
+
+    If ``ijson`` is available, the JSON output of ``conda search`` is parsed
+    incrementally (one package at a time) as it is read from the ``conda``
+    process.
+
+    Parameters
+    ----------
+    args : list
+        Extra arguments to pass to Conda ``search`` command.
+
+    Returns
+    -------
+    dict
+        See :func:`available_packages`.
+
+        Versions of each package are sorted in ascending order (i.e., by
+        version, then build number), as in ``conda search`` output.
+    '''
+    import conda_helpers as ch
+
+    if not args:
+        try:
+            from conda.api import SubdirData
+            from conda.models.version import VersionOrder
+        except ImportError:
+            pass
+        else:
+            # Repodata loaded by the Conda API is memoized for the lifetime of
+            # the process.  This function is only called if cached search
+            # results are missing or stale (see `available_packages()`), so
+            # discard in-process repodata to pick up channel changes.
+            subdir_cache = getattr(SubdirData, '_cache_', None)
+            if isinstance(subdir_cache, dict):
+                subdir_cache.clear()
+            # Group package records by name in a single pass.  Names are
+            # interned, so each distinct name is stored (and hashed) once.
+            records = defaultdict(list)
+            intern = sys.intern
+            for record_i in SubdirData.query_all('microdrop.*'):
+                records[intern(record_i.name)].append(record_i)
+            # Records are returned in channel/subdirectory order, so sort
+            # versions of each package to match `conda search` output.
+            return {name_i: [record_j.dump() for record_j in
+                             sorted(records_i,
+                                    key=lambda r: (VersionOrder(r.version),
+                                                   r.build_number))]
+                    for name_i, records_i in records.items()}
+    if ijson is None:
+        plugin_packages_info_json = ch.conda_exec('search', '--json',
+                                                  '^microdrop\.', *args,
+                                                  verbose=False)
+        return _json_loads(plugin_packages_info_json)
+
+    process = sp.Popen([_conda_executable(), 'search', '--json',
+                        r'^microdrop\.'] + list(args), stdout=sp.PIPE)
+    try:
+        # Output maps each package name to a list of package records.
+        packages = dict(ijson.kvitems(process.stdout, '', use_float=True))
+    finally:
+        process.stdout.close()
+        returncode = process.wait()
+    if returncode != 0:
+        # Error info (e.g., `"exception_name": "CondaHTTPError"`) is included
+        # in the JSON output.
+        raise RuntimeError('Error searching for plugin packages (return code '
+                           '== {}): {}'.format(returncode, packages))
+    return packages
+
+
+def _action_rev(action_file):
+    '''
+    Parameters
+    ----------
+    action_file : str
+        Action revision file path, e.g., ``.../rev12.json.bz2``.
+
+    Returns
+    -------
+    int
+        Revision number of action file, or ``-1`` if file name does not match
+        ``rev<revision>[.<ext>...]``.
+    '''
+    # Plain string checks are used, since they are faster than a regular
+    # expression for such a simple pattern.
+    stem = os.path.basename(action_file).split('.', 1)[0]
+    if stem.startswith('rev') and stem[3:].isdigit():
+        return int(stem[3:])
+    return -1
+
+
+def _save_action(extra_context=None, pretty=False):
     '''
     Save list of revisions revisions for active Conda environment.
 
@@ -65,6 +903,12 @@ def _save_action(extra_context=None):
     ----------
     extra_context : dict, optional
         Extra content to store in stored action revision.
+    pretty : bool, optional
+        If ``True``, indent JSON action, e.g., for inspection by a human.
+
+        By default, action is written as compact JSON.
+
+        .. versionadded:: 0.26
 
     Returns
     -------
@@ -73,21 +917,21 @@ def _save_action(extra_context=None):
         revisions for active Conda environment.
     '''
     # Get list of revisions to Conda environment since creation.
-    revisions_js = ch.conda_exec('list', '--revisions', '--json',
-                                 verbose=False)
-    revisions = json.loads(revisions_js)
+    #
+    # Note that the full list is stored in the action (the second-to-last
+    # revision is restored by `rollback()`).
+    revisions = _revisions()
     # Save list of revisions to `/etc/microdrop/plugins/actions/rev<rev>.json`
     # See [wheeler-microfluidics/microdrop#200][i200].
     #
     # [i200]: https://github.com/wheeler-microfluidics/microdrop/issues/200
     action = extra_context.copy() if extra_context else {}
     action['revisions'] = revisions
-    action_path = (MICRODROP_CONDA_ACTIONS
+    action_path = (_conda_path('MICRODROP_CONDA_ACTIONS')
                    .joinpath('rev{}.json.bz2'.format(revisions[-1]['rev'])))
-    action_path.parent.makedirs_p()
-    # Compress action file using bz2 to save disk space.
-    with bz2.BZ2File(action_path, mode='w') as output:
-        json.dump(action, output, indent=2)
+    # Compress action file to save disk space (using `bz2`, which is readable
+    # by all versions of this package).
+    _write_compressed(action_path, _json_dumps(action, pretty=pretty))
     return action_path, action
 
 
@@ -100,28 +944,40 @@ def _remove_broken_links():
     list
         List of links removed (if any).
     '''
-    enabled_dir = MICRODROP_CONDA_PLUGINS.joinpath('enabled')
+    enabled_dir = _conda_path('MICRODROP_PLUGINS_ENABLED')
     if not enabled_dir.isdir():
         return []
 
+    # Plugin links are direct children of the `enabled` directory, so only
+    # list the `enabled` directory itself (i.e., do **not** walk into plugin
+    # directories through the links).
     broken_links = []
-    for dir_i in enabled_dir.walkdirs(errors='ignore'):
-        if platform.system() == 'Windows':
-            if dir_i.isjunction() and not dir_i.readlink().isdir():
-                # Junction/link target no longer exists.
-                broken_links.append(dir_i)
-        else:
-            raise NotImplementedError('Unsupported platform')
-
-    removed_links = []
-    for link_i in broken_links:
+    with os.scandir(enabled_dir) as entries:
+        for entry_i in entries:
+            # Check for link/junction *before* checking target, since
+            # `DirEntry.is_dir()` reports a dangling junction as a directory
+            # on Windows.  Only follow links to check if their target still
+            # exists.
+            if (_entry_islinklike(entry_i) and
+                    not os.path.isdir(entry_i.path)):
+                broken_links.append(ph.path(entry_i.path))
+
+    def _unlink(link_i):
         try:
             link_i.unlink()
         except:
-            pass
-        else:
-            removed_links.append(link_i)
-    return removed_links
+            return False
+        return True
+
+    if len(broken_links) > 1:
+        # Overlap unlink calls (e.g., on network drives).
+        executor = ThreadPoolExecutor(max_workers=min(8, len(broken_links)))
+        with executor:
+            removed = list(executor.map(_unlink, broken_links))
+    else:
+        removed = list(map(_unlink, broken_links))
+    return [link_i for link_i, removed_i in zip(broken_links, removed)
+            if removed_i]
 
 
 # ## Supporting legacy MicroDrop plugins ##
@@ -137,10 +993,36 @@ def available_packages(*args, **kwargs):
     '''
     Query available plugin packages based on specified Conda channels.
 
+    .. versionchanged:: 0.26
+        Cache results in :data:`MICRODROP_CONDA_CACHE`.  The ``conda search``
+        command is only run if the revision of the plugin channel(s) (i.e.,
+        the repodata ``ETag``) or of the Conda environment has changed.
+
+        Pass :data:`*args` to Conda ``search`` command.
+
+        Query Conda API in-process (i.e., without launching a ``conda``
+        subprocess) if ``conda`` is importable and no :data:`*args` are
+        specified.
+
+        Reuse plugin channel revision for up to :data:`cache_ttl` seconds
+        (i.e., without querying the channel server(s)), unless the Conda
+        environment has been modified.
+
     Parameters
     ----------
     *args
         Extra arguments to pass to Conda ``search`` command.
+    cache_ttl : float, optional
+        Number of seconds for which a plugin channel revision is reused
+        (default: :data:`AVAILABLE_CACHE_TTL`).  Set to ``0`` to always query
+        the channel server(s).
+
+        .. versionadded:: 0.26
+    refresh : bool, optional
+        If ``True``, ignore cached results, i.e., always run the ``conda
+        search`` command.
+
+        .. versionadded:: 0.26
 
     Returns
     -------
@@ -174,12 +1056,82 @@ def available_packages(*args, **kwargs):
                 ...
             }
     '''
+    cache_ttl = kwargs.pop('cache_ttl', AVAILABLE_CACHE_TTL)
+    refresh = kwargs.pop('refresh', False)
+
+    # Reuse revision of plugin channel(s) if probed within the last
+    # `cache_ttl` seconds (and the Conda environment has not changed since).
+    #
+    # Note that a single probe file and a single cache file are used (each
+    # storing the key it is valid for), i.e., stale files are overwritten
+    # rather than accumulating in the cache directory.
+    cache_key = None
+    probe_key = _digest([list(args), _history_mtime()])
+    probe_path = _conda_path('MICRODROP_CONDA_CACHE', 'probe.json')
+    cache_path = _conda_path('MICRODROP_CONDA_CACHE',
+                             'available.json' + _COMPRESSED_EXT)
+    if not refresh and cache_ttl:
+        if probe_key in _AVAIL_PROBES:
+            # Probed earlier in this process.
+            probe_time, cache_key = _AVAIL_PROBES[probe_key]
+        else:
+            try:
+                probe_time = os.stat(probe_path).st_mtime
+                probe = _json_loads(probe_path.bytes())
+            except Exception:
+                pass
+            else:
+                if probe.get('probe') == probe_key:
+                    cache_key = probe.get('key')
+                    _AVAIL_PROBES[probe_key] = probe_time, cache_key
+        if cache_key is not None and time.time() - probe_time >= cache_ttl:
+            cache_key = None
+    # Look up cached result for current revision of plugin channel(s).
+    if cache_key is None:
+        try:
+            cache_key = _available_cache_key(args)
+        except Exception:
+            logger.debug('Could not determine plugin channel revision.',
+                         exc_info=True)
+        else:
+            if cache_key is not None:
+                _AVAIL_PROBES[probe_key] = time.time(), cache_key
+                try:
+                    _write_compressed(probe_path,
+                                      _json_dumps({'probe': probe_key,
+                                                   'key': cache_key}))
+                except Exception:
+                    logger.debug('Error writing cache: `%s`', probe_path,
+                                 exc_info=True)
+    if cache_key is not None and not refresh:
+        if cache_key in _AVAIL_CACHE:
+            return _AVAIL_CACHE[cache_key]
+        if cache_path.isfile():
+            try:
+                cached = _json_loads(_read_compressed(cache_path))
+            except Exception:
+                logger.debug('Error reading cache: `%s`', cache_path,
+                             exc_info=True)
+            else:
+                if cached.get('key') == cache_key:
+                    packages = cached['packages']
+                    _AVAIL_CACHE[cache_key] = packages
+                    return packages
+
     # Get list of available MicroDrop plugins, i.e., Conda packages that start
     # with the prefix `microdrop.`.
     try:
-        plugin_packages_info_json = ch.conda_exec('search', '--json',
-                                                  '^microdrop\.', verbose=False)
-        return json.loads(plugin_packages_info_json)
+        packages = _search_plugin_packages(args)
+        if cache_key is not None:
+            _AVAIL_CACHE[cache_key] = packages
+            try:
+                _write_compressed(cache_path,
+                                  _json_dumps({'key': cache_key,
+                                               'packages': packages}))
+            except Exception:
+                logger.debug('Error writing cache: `%s`', cache_path,
+                             exc_info=True)
+        return packages
     except RuntimeError as exception:
         if 'CondaHTTPError' in str(exception):
             logger.warning('Could not connect to Conda server.')
@@ -187,8 +1139,12 @@ def available_packages(*args, **kwargs):
             logger.warning('Error querying available MicroDrop plugins.',
                            exc_info=True)
     except Exception as exception:
-        logger.warning('Error querying available MicroDrop plugins.',
-                       exc_info=True)
+        if type(exception).__name__ == 'CondaHTTPError':
+            # Raised by in-process Conda API.
+            logger.warning('Could not connect to Conda server.')
+        else:
+            logger.warning('Error querying available MicroDrop plugins.',
+                           exc_info=True)
     return {}
 
 
@@ -214,21 +1170,51 @@ def install(plugin_name, *args, **kwargs):
         Version specifiers are also supported, e.g., ``package >=1.0.5``.
     *args
         Extra arguments to pass to Conda ``install`` command.
+    progress_callback : callable, optional
+        Called with ``(fraction, message)`` for each progress message reported
+        by Conda (e.g., while downloading packages), where ``fraction`` is
+        between 0 and 1 and ``message`` is, e.g., the name of the package
+        being downloaded.
+
+        .. versionadded:: 0.26
 
     Returns
     -------
     dict
         Conda installation log object (from JSON Conda install output).
+
+    .. versionchanged:: 0.26
+        Skip Conda install if every package is specified with an exact version
+        (e.g., ``package ==1.0.5``) that is already installed.
     '''
-    if isinstance(plugin_name, (str,)):
+    import conda_helpers as ch
+
+    # Pass all packages to a single `conda install` call (i.e., one solver
+    # run, regardless of the number of packages).
+    if isinstance(plugin_name, str):
         plugin_name = [plugin_name]
+    else:
+        plugin_name = list(plugin_name)
+
+    if not args and _pinned_specs_installed(plugin_name):
+        # Every requested package is already installed at the pinned version,
+        # so skip running the Conda solver.
+        logger.debug('Requested plugin(s) already installed: %s',
+                     ', '.join(plugin_name))
+        return {'success': True,
+                'message': 'All requested packages already installed.'}
 
     # Perform installation
     conda_args = (['install', '-y', '--json'] + list(args) + plugin_name)
-    install_log_js = ch.conda_exec(*conda_args, verbose=False)
-    install_log = json.loads(install_log_js.split('\x00')[-1])
+    progress_callback = kwargs.get('progress_callback')
+    if progress_callback is None:
+        install_log_js = ch.conda_exec(*conda_args, verbose=False)
+        install_log = _json_loads(_last_json_chunk(install_log_js))
+    else:
+        install_log = _conda_exec_progress(conda_args, progress_callback)
     if 'actions' in install_log and not install_log.get('dry_run'):
         # Install command modified Conda environment.
+        _clear_caches()
         _save_action({'conda_args': conda_args, 'install_log': install_log})
         logger.debug('Installed plugin(s): ```%s```', install_log['actions'])
     return install_log
@@ -251,6 +1237,9 @@ def rollback(*args, **kwargs):
 
         Note that channels can still be explicitly set through :data:`*args`.
 
+    .. versionchanged:: 0.26
+        Add support for action revision files compressed using ``zstd``.
+
     Parameters
     ----------
     *args
@@ -267,34 +1256,35 @@ def rollback(*args, **kwargs):
 
     `wheeler-microfluidics/microdrop#200 <https://github.com/wheeler-microfluidics/microdrop/issues/200>`
     '''
-    action_files = MICRODROP_CONDA_ACTIONS.files()
-    if not action_files:
+    import conda_helpers as ch
+
+    # Get file associated with most recent action.
+    actions_dir = _conda_path('MICRODROP_CONDA_ACTIONS')
+    if actions_dir.isdir():
+        # Single pass over directory listing, reusing file type info from
+        # `scandir()` rather than querying each entry separately.
+        with os.scandir(actions_dir) as entries:
+            action_file = max((entry_i.path for entry_i in entries
+                               if entry_i.is_file()), key=_action_rev,
+                              default=None)
+    else:
+        action_file = None
+    if action_file is None or _action_rev(action_file) < 0:
         # No action files, return current revision.
         logger.debug('No rollback actions have been recorded.')
-        revisions_js = ch.conda_exec('list', '--revisions', '--json',
-                                     verbose=False)
-        revisions = json.loads(revisions_js)
-        return revisions[-1]['rev']
-    # Get file associated with most recent action.
-    cre_rev = re.compile(r'rev(?P<rev>\d+)')
-    action_file = sorted([(int(cre_rev.match(file_i.namebase).group('rev')),
-                           file_i) for file_i in
-                          action_files if cre_rev.match(file_i.namebase)],
-                         reverse=True)[0]
+        # Only the most recent revision is required.
+        return _revisions()[-1]['rev']
     # Do rollback (i.e., install state of previous revision).
-    if action_file.ext.lower() == '.bz2':
-        # Assume file is compressed using bz2.
-        with bz2.BZ2File(action_file, mode='r') as input_:
-            action = json.load(input_)
-    else:
-        # Assume it is raw JSON.
-        with action_file.open('r') as input_:
-            action = json.load(input_)
-    rollback_revision = action['revisions'][-2]
+    #
+    # Action file may be compressed using `zstd` (`.zst`) or `bz2` (`.bz2`),
+    # or may be raw JSON.
+    action = _json_loads(_read_compressed(action_file))
+    rollback_revision = action['revisions'][-2]['rev']
     conda_args = (['install', '--json'] + list(args) +
                   ['--revision', str(rollback_revision)])
     install_log_js = ch.conda_exec(*conda_args, verbose=False)
-    install_log = json.loads(install_log_js.split('\x00')[-1])
+    _clear_caches()
+    install_log = _json_loads(_last_json_chunk(install_log_js))
     logger.debug('Rolled back to revision %s', rollback_revision)
     return rollback_revision, install_log
 
@@ -322,27 +1312,33 @@ def uninstall(plugin_name, *args):
     dict
         Conda uninstallation log object (from JSON Conda uninstall output).
     '''
-    if isinstance(plugin_name, (str,)):
+    import conda_helpers as ch
+
+    if isinstance(plugin_name, str):
         plugin_name = [plugin_name]
 
-    available_path = MICRODROP_CONDA_SHARE.joinpath('plugins', 'available')
+    available_path = _conda_path('MICRODROP_PLUGINS_AVAILABLE')
+    # List plugin directories (or links) in available path once, rather than
+    # querying the file system for each plugin name.
+    available_names = _plugin_entry_names(available_path)
     for name_i in plugin_name:
         plugin_module_i = name_i.split('.')[-1].replace('-', '_')
-        plugin_path_i = available_path.joinpath(plugin_module_i)
-        if not _islinklike(plugin_path_i) and not plugin_path_i.isdir():
+        if plugin_module_i not in available_names:
             raise IOError('Plugin `{}` not found in `{}`'
                           .format(name_i, available_path))
         else:
-            logging.debug('[uninstall] Found plugin `%s`', plugin_path_i)
+            logging.debug('[uninstall] Found plugin `%s`',
+                          available_path.joinpath(plugin_module_i))
 
     # Perform uninstall operation.
     conda_args = ['uninstall', '--json', '-y'] + list(args) + plugin_name
     uninstall_log_js = ch.conda_exec(*conda_args, verbose=False)
+    _clear_caches()
     # Remove broken links in `<conda prefix>/etc/microdrop/plugins/enabled/`,
     # since uninstall may have made one or more packages unavailable.
     _remove_broken_links()
     logger.debug('Uninstalled plugins: ```%s```', plugin_name)
-    return json.loads(uninstall_log_js.split('\x00')[-1])
+    return _json_loads(_last_json_chunk(uninstall_log_js))
 
 
 #      * [x] Enable/disable installed plugin package(s)
@@ -373,24 +1369,28 @@ def enable_plugin(plugin_name):
     IOError
         If plugin is not installed to ``<conda prefix>/share/microdrop/plugins/available/``.
     '''
-    if isinstance(plugin_name, (str,)):
+    if isinstance(plugin_name, str):
         plugin_name = [plugin_name]
         singleton = True
     else:
         singleton = False
 
     # Conda-managed plugins
-    shared_available_path = MICRODROP_CONDA_SHARE.joinpath('plugins',
-                                                           'available')
+    shared_available_path = _conda_path('MICRODROP_PLUGINS_AVAILABLE')
     # User-managed plugins
-    etc_available_path = MICRODROP_CONDA_ETC.joinpath('plugins', 'available')
+    etc_available_path = _conda_path('MICRODROP_ETC_PLUGINS_AVAILABLE')
 
     available_paths = (etc_available_path, shared_available_path)
+    # List plugin directories in each available path once, rather than
+    # querying the file system for each plugin name.
+    available_names = [_plugin_dir_names(available_path_j)
+                       for available_path_j in available_paths]
     plugin_paths = []
     for name_i in plugin_name:
-        for available_path_j in available_paths:
-            plugin_path_ij = available_path_j.joinpath(name_i)
-            if not _islinklike(plugin_path_ij) and plugin_path_ij.isdir():
+        for available_path_j, names_j in zip(available_paths,
+                                             available_names):
+            if name_i in names_j:
+                plugin_path_ij = available_path_j.joinpath(name_i)
                 logger.debug('Found plugin directory: `%s`', plugin_path_ij)
                 break
         else:
@@ -402,7 +1402,7 @@ def enable_plugin(plugin_name):
 
     # Link all specified plugins in
     # `<conda prefix>/etc/microdrop/plugins/enabled/` (if not already linked).
-    enabled_path = MICRODROP_CONDA_PLUGINS.joinpath('enabled')
+    enabled_path = _conda_path('MICRODROP_PLUGINS_ENABLED')
     enabled_path.makedirs_p()
 
     # Set flag for each plugin: `False` iff the plugin was already enabled,
@@ -411,10 +1411,11 @@ def enable_plugin(plugin_name):
     for plugin_path_i in plugin_paths:
         plugin_link_path_i = enabled_path.joinpath(plugin_path_i.name)
         if not plugin_link_path_i.exists():
-            if platform.system() == 'Windows':
-                plugin_path_i.junction(plugin_link_path_i)
-            else:
-                plugin_path_i.symlink(plugin_link_path_i)
+            if os.path.lexists(plugin_link_path_i):
+                # Replace broken link (e.g., to a plugin that was removed and
+                # reinstalled), rather than failing to create link.
+                plugin_link_path_i.unlink()
+            _make_link(plugin_path_i, plugin_link_path_i)
             logger.debug('Enabled plugin directory: `%s` -> `%s`',
                          plugin_path_i, plugin_link_path_i)
             enabled_now[plugin_path_i.name] = True
@@ -439,26 +1440,29 @@ def disable_plugin(plugin_name):
     IOError
         If plugin is not enabled.
     '''
-    if isinstance(plugin_name, (str,)):
+    if isinstance(plugin_name, str):
         plugin_name = [plugin_name]
 
     # Verify all specified plugins are currently enabled.
-    enabled_path = MICRODROP_CONDA_PLUGINS.joinpath('enabled')
+    enabled_path = _conda_path('MICRODROP_PLUGINS_ENABLED')
+    # List enabled plugin links (or directories) once, rather than querying
+    # the file system for each plugin name.
+    enabled_names = _plugin_entry_names(enabled_path)
     for name_i in plugin_name:
-        plugin_path_i = enabled_path.joinpath(name_i)
-        if not _islinklike(plugin_path_i) and not plugin_path_i.isdir():
+        if name_i not in enabled_names:
             raise IOError('Plugin `{}` not found in `{}`'
                           .format(name_i, enabled_path))
+    plugin_link_paths = [enabled_path.joinpath(name_i)
+                         for name_i in plugin_name]
 
     # All specified plugins are enabled.
 
     # Remove all specified plugins from
     # `<conda prefix>/etc/microdrop/plugins/enabled/`.
-    for name_i in plugin_name:
-        plugin_link_path_i = enabled_path.joinpath(name_i)
+    for name_i, plugin_link_path_i in zip(plugin_name, plugin_link_paths):
         plugin_link_path_i.unlink()
-        logger.debug('Disabled plugin `%s` (i.e., removed `%s`)',
-                     plugin_path_i, plugin_link_path_i)
+        logger.debug('Disabled plugin `%s` (i.e., removed `%s`)', name_i,
+                     plugin_link_path_i)
 
 
 def update(*args, **kwargs):
@@ -512,18 +1516,25 @@ def update(*args, **kwargs):
     '''
     package_name = kwargs.pop('package_name', None)
 
+    # Fast path: no plugin directories are present, so there is nothing to
+    # update (skip reading plugin properties and querying Conda).
+    if not _plugin_dir_names(_conda_path('MICRODROP_PLUGINS_AVAILABLE')):
+        return {}
+
     # Only consider **installed** plugins (see `installed_plugins()` docstring).
-    installed_plugins_ = installed_plugins(only_conda=True)
+    installed_plugins_ = installed_plugins(only_conda=True,
+                                           fields=('package_name', ))
     if installed_plugins_:
         plugin_packages = [plugin_i['package_name']
                            for plugin_i in installed_plugins_]
         if package_name is None:
             package_name = plugin_packages
-        elif isinstance(package_name, (str,)):
+        elif isinstance(package_name, str):
             package_name = [package_name]
-        logger.info('Installing any available updates for plugins: %s',
-                    ','.join('`{}`'.format(package_name_i)
-                             for package_name_i in package_name))
+        if logger.isEnabledFor(logging.INFO):
+            logger.info('Installing any available updates for plugins: %s',
+                        ','.join('`{}`'.format(package_name_i)
+                                 for package_name_i in package_name))
         # Attempt to install plugin packages.
         try:
             install_log = install(package_name, *args, **kwargs)
@@ -562,20 +1573,23 @@ def import_plugin(package_name, include_available=False):
     module
         Imported plugin module.
     '''
-    available_plugins_dir = MICRODROP_CONDA_SHARE.joinpath('plugins',
-                                                           'available')
-    enabled_plugins_dir = MICRODROP_CONDA_ETC.joinpath('plugins', 'enabled')
+    available_plugins_dir = _conda_path('MICRODROP_PLUGINS_AVAILABLE')
+    enabled_plugins_dir = _conda_path('MICRODROP_PLUGINS_ENABLED')
     search_paths = [enabled_plugins_dir]
     if include_available:
         search_paths += [available_plugins_dir]
-    for dir_i in search_paths:
-        if dir_i not in sys.path:
-            sys.path.insert(0, dir_i)
+    # Prepend missing directories to import paths in a single insertion (last
+    # search path first, i.e., same order as inserting each at index 0).
+    present = set(sys.path)
+    missing = [str(dir_i) for dir_i in reversed(search_paths)
+               if dir_i not in present]
+    if missing:
+        sys.path[:0] = missing
     module_name = package_name.split('.')[-1].replace('-', '_')
     return importlib.import_module(module_name)
 
 
-def installed_plugins(only_conda=False):
+def installed_plugins(only_conda=False, fields=None):
     '''
     .. versionadded:: 0.20
 
@@ -585,6 +1599,13 @@ def installed_plugins(only_conda=False):
         Only consider plugins that are installed **as Conda packages**.
 
         .. versionadded:: 0.22
+    fields : list, optional
+        Names of properties to include for each plugin (``package_name`` is
+        always included).
+
+        By default, all properties are included, including ``path``.
+
+        .. versionadded:: 0.26
 
     Returns
     -------
@@ -601,49 +1622,52 @@ def installed_plugins(only_conda=False):
 
             If :data:`only_conda` is ``True``, only properties for plugins that
             are installed **as Conda packages** are returned.
+
+        .. versionchanged:: 0.26
+
+            Results are cached until the ``share/microdrop/plugins/available``
+            directory is modified, or until the Conda environment is modified
+            through this module (e.g., :func:`install`).
     '''
-    available_path = MICRODROP_CONDA_SHARE.joinpath('plugins', 'available')
+    available_path = _conda_path('MICRODROP_PLUGINS_AVAILABLE')
     if not available_path.isdir():
         return []
+    if fields is not None:
+        fields = frozenset(fields) | {'package_name'}
+    cache_key = (only_conda, fields, os.stat(available_path).st_mtime_ns)
+    if cache_key in _INSTALLED_CACHE:
+        return list(_INSTALLED_CACHE[cache_key])
+
     installed_plugins_ = []
-    for plugin_path_i in available_path.dirs():
-        # Only process plugin directory if it is *not a link*.
-        if not _islinklike(plugin_path_i):
-            # Read plugin package info from `properties.yml` file.
-            try:
-                with plugin_path_i.joinpath('properties.yml').open('r') as input_:
-                    properties_i = yaml.load(input_.read())
-            except:
-                logger.info('[warning] Could not read package info: `%s`',
-                            plugin_path_i.joinpath('properties.yml'),
-                            exc_info=True)
-            else:
-                properties_i['path'] = plugin_path_i.realpath()
+    # Use `scandir()` to reuse file type info from directory listing, rather
+    # than querying each entry separately.
+    with os.scandir(available_path) as entries:
+        for entry_i in entries:
+            # Only process plugin directory if it is *not a link*.
+            if (not entry_i.is_dir(follow_symlinks=False) or
+                    _entry_islinklike(entry_i)):
+                continue
+            properties_i = _plugin_properties(entry_i.path, fields)
+            if properties_i is not None:
                 installed_plugins_.append(properties_i)
 
     if only_conda:
         # Only consider plugins that are installed **as Conda packages**.
-        try:
-            package_names = [plugin_i['package_name']
-                             for plugin_i in installed_plugins_]
-            conda_package_infos = ch.package_version(package_names,
-                                                     verbose=False)
-        except ch.PackageNotFound as exception:
-            # At least one specified plugin package name did not correspond to an
-            # installed Conda package.
-            logger.warning(str(exception))
-            conda_package_infos = exception.available
+        package_names = frozenset(plugin_i['package_name']
+                                  for plugin_i in installed_plugins_)
+        conda_package_infos = _installed_packages(package_names)
         # Extract name from each Conda plugin package.
         installed_package_names = set([package_i['name']
                                        for package_i in conda_package_infos])
-        return [plugin_i for plugin_i in installed_plugins_
-                if plugin_i['package_name'] in installed_package_names]
-    else:
-        # Return all available plugins.
-        return installed_plugins_
+        installed_plugins_ = [plugin_i for plugin_i in installed_plugins_
+                              if plugin_i['package_name'] in
+                              installed_package_names]
 
+    _INSTALLED_CACHE[cache_key] = installed_plugins_
+    return list(installed_plugins_)
 
-def enabled_plugins(installed_only=True):
+
+def enabled_plugins(installed_only=True, fields=None):
     '''
     .. versionadded:: 0.21
 
@@ -652,6 +1676,13 @@ def enabled_plugins(installed_only=True):
     installed_only : bool, optional
         Only consider enabled plugins that are installed in the Conda
         environment.
+    fields : list, optional
+        Names of properties to include for each plugin (``package_name`` is
+        always included).
+
+        By default, all properties are included, including ``path``.
+
+        .. versionadded:: 0.26
 
     Returns
     -------
@@ -670,51 +1701,48 @@ def enabled_plugins(installed_only=True):
         directory or a link/junction.
 
     '''
-    enabled_path = MICRODROP_CONDA_PLUGINS.joinpath('enabled')
+    enabled_path = _conda_path('MICRODROP_PLUGINS_ENABLED')
     if not enabled_path.isdir():
         return []
+    if fields is not None:
+        fields = frozenset(fields) | {'package_name'}
 
     # Construct list of property dictionaries, one per enabled plugin
     # directory.
     enabled_plugins_ = []
-    for plugin_path_i in enabled_path.dirs():
-        if not installed_only or _islinklike(plugin_path_i):
-            # Enabled plugin path is either **a link to an installed plugin**
-            # or call explicitly specifies that plugins that are not installed
-            # should still be considered.
-
-            # Read plugin package info from `properties.yml` file.
-            try:
-                with plugin_path_i.joinpath('properties.yml').open('r') as input_:
-                    properties_i = yaml.load(input_.read())
-            except:
-                logger.info('[warning] Could not read package info: `%s`',
-                            plugin_path_i.joinpath('properties.yml'),
-                            exc_info=True)
+    # Use `scandir()` to reuse file type info from directory listing, rather
+    # than querying each entry separately.
+    with os.scandir(enabled_path) as entries:
+        for entry_i in entries:
+            islinklike_i = _entry_islinklike(entry_i)
+            if islinklike_i:
+                # Note that `DirEntry.is_dir()` reports a dangling junction as
+                # a directory on Windows, so follow link to check target.
+                if not os.path.isdir(entry_i.path):
+                    continue
+            elif not entry_i.is_dir():
                 continue
-            else:
-                properties_i['path'] = plugin_path_i.realpath()
-                enabled_plugins_.append(properties_i)
+            if not installed_only or islinklike_i:
+                # Enabled plugin path is either **a link to an installed
+                # plugin** or call explicitly specifies that plugins that are
+                # not installed should still be considered.
+                properties_i = _plugin_properties(entry_i.path, fields)
+                if properties_i is not None:
+                    enabled_plugins_.append(properties_i)
 
     if installed_only:
         # Only consider enabled plugins that are installed in the Conda
         # environment.
-        try:
-            # Attempt to look up installed Conda package info for each enabled
-            # plugin.
-            package_names = [properties_i['package_name']
-                             for properties_i in enabled_plugins_]
-            installed_info = ch.package_version(package_names, verbose=False)
-        except ch.PackageNotFound as exception:
-            # Failed to find a corresponding installed Conda package for at
-            # least one enabled plugin.
-            logger.warning(str(exception))
-            available_names = set([package_i['name']
-                                   for package_i in exception.available])
-            # Only return list of enabled plugins that have a corresponding
-            # Conda package installed.
-            return [properties_i for properties_i in enabled_plugins_
-                    if properties_i['package_name'] in available_names]
+        #
+        # Look up installed Conda package info for each enabled plugin.
+        package_names = frozenset(properties_i['package_name']
+                                  for properties_i in enabled_plugins_)
+        available_names = set(package_i['name'] for package_i in
+                              _installed_packages(package_names))
+        # Only return list of enabled plugins that have a corresponding
+        # Conda package installed.
+        return [properties_i for properties_i in enabled_plugins_
+                if properties_i['package_name'] in available_names]
 
     # Return list of all enabled plugins, regardless of whether or not they
     # have corresponding Conda packages installed.
@@ -6,7 +6,6 @@ import logging
 import sys
 
 from path_helpers import path
-import si_prefix as si
 
 from .. import pformat_dict
 from ..commands import (DEFAULT_INDEX_HOST, freeze, get_plugins_directory,
@@ -74,15 +73,22 @@ hook_parser.add_argument('hook', choices=['on_install'], help='Plugin hook')
 hook_parser.add_argument('plugin', nargs='*')
 
 
-def parse_args(args=None):
-    '''Parses arguments, returns ``(options, args)``.'''
-    if args is None:
-        args = sys.argv
+# Top-level parser is constructed once (i.e., not on every `parse_args()`
+# call).
+_PARSER = ArgumentParser(description='MicroDrop plugin manager',
+                         parents=[MPM_PARSER])
 
-    parser = ArgumentParser(description='MicroDrop plugin manager',
-                            parents=[MPM_PARSER])
 
-    return parser.parse_args()
+def parse_args(args=None):
+    '''
+    Parses arguments, returns ``(options, args)``.
+
+    Parameters
+    ----------
+    args : list, optional
+        Command-line arguments (default: ``sys.argv[1:]``).
+    '''
+    return _PARSER.parse_args(args)
 
 
 def validate_args(args):
@@ -171,6 +177,8 @@ def main(args=None):
                 print(exception.message)
                 continue
     elif args.command == 'search':
+        import si_prefix as si
+
         try:
             plugin_name, releases = search(plugin_package=args.plugin,
                                            server_url=args.server_url)
@@ -1,12 +1,14 @@
 # coding: utf-8
 from argparse import ArgumentParser
-import json
 import logging
+import os
 import sys
 
 from . import LOG_PARSER
-from ..api import (MICRODROP_CONDA_ETC, MICRODROP_CONDA_SHARE, disable_plugin,
-                   enable_plugin)
+# Note: Conda path constants (e.g., `MICRODROP_PLUGINS_AVAILABLE`) are looked
+# up through the module on use, since resolving them queries the Conda prefix.
+from .. import api
+from ..api import disable_plugin, enable_plugin
 
 
 PLUGIN_PARSER = ArgumentParser(add_help=False, parents=[LOG_PARSER])
@@ -27,16 +29,23 @@ enabled_parser = subparsers.add_parser('enabled', help='List enabled plugins.')
 list_parser = subparsers.add_parser('list', help='List available plugins.')
 
 
-def parse_args(args=None):
-    '''Parses arguments, returns ``(options, args)``.'''
-    if args is None:
-        args = sys.argv
+# Top-level parser is constructed once (i.e., not on every `parse_args()`
+# call).
+_PARSER = ArgumentParser(description='Actions related to available '
+                         'MicroDrop Conda package plugin(s).',
+                         parents=[PLUGIN_PARSER])
+
 
-    parser = ArgumentParser(description='Actions related to available '
-                            'MicroDrop Conda package plugin(s).',
-                            parents=[PLUGIN_PARSER])
+def parse_args(args=None):
+    '''
+    Parses arguments, returns ``(options, args)``.
 
-    return parser.parse_args()
+    Parameters
+    ----------
+    args : list, optional
+        Command-line arguments (default: ``sys.argv[1:]``).
+    '''
+    return _PARSER.parse_args(args)
 
 
 
@@ -49,11 +58,24 @@ def _dump_list(list_data, jsonify, stream=sys.stdout):
     list_data : list
     jsonify : bool
     stream : file-like
+
+    .. versionchanged:: 0.26
+        Write encoded output directly to binary buffer of :data:`stream` (if
+        available), bypassing text layer.  JSON is encoded using fastest
+        available library (e.g., :mod:`orjson`).
     '''
     if not jsonify and list_data:
-        print('\n'.join(list_data), file=stream)
+        data = '\n'.join(list_data).encode('utf8')
+    else:
+        data = api._json_dumps(list_data)
+    buffer_ = getattr(stream, 'buffer', None)
+    if buffer_ is None:
+        # Text-only stream (e.g., `io.StringIO`).
+        stream.write(data.decode('utf8') + '\n')
     else:
-        print(json.dumps(list_data), file=stream)
+        stream.flush()
+        buffer_.write(data + b'\n')
+        buffer_.flush()
 
 
 def main(args=None):
@@ -65,17 +87,15 @@ def main(args=None):
                         stream=sys.stderr)
 
     if args.command == 'list':
-        available_plugin_paths = sorted(MICRODROP_CONDA_SHARE
-                                        .joinpath('plugins',
-                                                  'available').dirs())
-        available_plugins = list(map(str, [plugin_i.name
-                                      for plugin_i in available_plugin_paths]))
+        # Use `scandir()` to reuse file type info from directory listing.
+        with os.scandir(api.MICRODROP_PLUGINS_AVAILABLE) as entries:
+            available_plugins = sorted(entry_i.name for entry_i in entries
+                                       if entry_i.is_dir())
         _dump_list(available_plugins, args.json)
     elif args.command == 'enabled':
-        enabled_plugin_paths = sorted(MICRODROP_CONDA_ETC
-                                      .joinpath('plugins', 'enabled').dirs())
-        enabled_plugins = list(map(str, [plugin_i.name
-                                    for plugin_i in enabled_plugin_paths]))
+        with os.scandir(api.MICRODROP_PLUGINS_ENABLED) as entries:
+            enabled_plugins = sorted(entry_i.name for entry_i in entries
+                                     if entry_i.is_dir())
         _dump_list(enabled_plugins, args.json)
     elif args.command == 'enable':
         enabled_now = enable_plugin(args.plugin)
@@ -1,15 +1,17 @@
 import argparse
+import importlib.util
 import logging
 import os
 import subprocess as sp
 import sys
-import zipfile
 
 import path_helpers as ph
-import yaml
 
 logger = logging.getLogger(__name__)
 
+#: Path of available plugins directory, relative to Conda prefix.
+_PLUGINS_AVAILABLE = ('share', 'microdrop', 'plugins', 'available')
+
 
 def parse_args(args=None):
     '''
@@ -31,26 +33,64 @@ def parse_args(args=None):
     # [1]: https://unix.stackexchange.com/a/108141/187716
     parser.add_argument('-V', '--version-number', nargs='?')
 
-    parsed_args = parser.parse_args()
+    return _resolve_defaults(parser.parse_args(args))
+
+
+def _resolve_defaults(parsed_args):
+    '''
+    Fill in unspecified arguments from Conda build environment variables.
+
+    Parameters
+    ----------
+    parsed_args : argparse.Namespace
+        Parsed command-line arguments.
+
+    Returns
+    -------
+    argparse.Namespace
+        :data:`parsed_args`, with ``source_dir``, ``target_dir``, and
+        ``package_name`` set.
+    '''
     if not parsed_args.source_dir:
         parsed_args.source_dir = ph.path(os.environ['SRC_DIR'])
-    if not parsed_args.target_dir:
-        prefix_dir = ph.path(os.environ['PREFIX'])
-        # Extract module name from Conda package name.
-        #
-        # For example, the module name for a package named
-        # `microdrop.droplet_planning_plugin` would be
-        # `droplet_planning_plugin`.
-        module_name = os.environ['PKG_NAME'].split('.')[-1].replace('-', '_')
-        parsed_args.target_dir = prefix_dir.joinpath('share', 'microdrop',
-                                                     'plugins', 'available',
-                                                     module_name)
-    if not parsed_args.package_name:
-        parsed_args.package_name = os.environ['PKG_NAME']
-
+    if not parsed_args.package_name or not parsed_args.target_dir:
+        package_name = os.environ['PKG_NAME']
+        if not parsed_args.target_dir:
+            # Extract module name from Conda package name.
+            #
+            # For example, the module name for a package named
+            # `microdrop.droplet_planning_plugin` would be
+            # `droplet_planning_plugin`.
+            module_name = package_name.split('.')[-1].replace('-', '_')
+            parsed_args.target_dir = (ph.path(os.environ['PREFIX'])
+                                      .joinpath(*(_PLUGINS_AVAILABLE +
+                                                  (module_name, ))))
+        if not parsed_args.package_name:
+            parsed_args.package_name = package_name
     return parsed_args
 
 
+def _skip_member(member):
+    '''
+    Parameters
+    ----------
+    member : tarfile.TarInfo
+        Member of source ``git archive``.
+
+    Returns
+    -------
+    bool
+        ``True`` if member should **not** be included in plugin release, i.e.,
+        ``bld.bat``, Conda build recipe (i.e., ``.conda-recipe/*``), or
+        top-level git files (e.g., ``.gitignore``).
+    '''
+    root, separator, _ = member.name.partition('/')
+    if root == '.conda-recipe':
+        return True
+    return not separator and (root == 'bld.bat' or
+                              (member.isfile() and root.startswith('.git')))
+
+
 def build(source_dir, target_dir, package_name=None, version_number=None):
     '''
     Create a release of a MicroDrop plugin source directory in the target
@@ -70,6 +110,16 @@ def build(source_dir, target_dir, package_name=None, version_number=None):
     .. versionchanged:: 0.25
         Add optional :data:`version_number` argument.
 
+    .. versionchanged:: 0.26
+        Stream ``git archive`` output directly to target directory (i.e., do
+        not write temporary archive to source directory).
+
+        Skip excluded patterns during extraction (rather than deleting them
+        after extraction).
+
+        Load ``_version.py`` from source directory by path, rather than
+        changing the working directory of the process.
+
     Parameters
     ----------
     source_dir : str
@@ -84,55 +134,66 @@ def build(source_dir, target_dir, package_name=None, version_number=None):
         If not specified, assume version package exposes version using
         `versioneer <https://github.com/warner/python-versioneer>`_.
     '''
+    # Import archive and YAML modules on use (i.e., not when only parsing
+    # command-line arguments, e.g., `--help`).
+    import tarfile
+
+    import yaml
+    try:
+        # Use `libyaml`-backed dumper, if available.
+        from yaml import CSafeDumper as Dumper
+    except ImportError:
+        from yaml import SafeDumper as Dumper
+
     source_dir = ph.path(source_dir).realpath()
     target_dir = ph.path(target_dir).realpath()
     target_dir.makedirs_p()
-    source_archive = source_dir.joinpath(source_dir.name + '.zip')
     if package_name is None:
         package_name = str(target_dir.name)
     logger.info('Source directory: %s', source_dir)
-    logger.info('Source archive: %s', source_archive)
     logger.info('Target directory: %s', target_dir)
     logger.info('Package name: %s', package_name)
 
     # Export git archive, which substitutes version expressions in
     # `_version.py` to reflect the state (i.e., revision and tag info) of the
     # git repository.
-    original_dir = ph.path(os.getcwd())
+    #
+    # Stream archive directly into Conda MicroDrop plugins directory (i.e.,
+    # without writing temporary archive file to disk).
+    process = sp.Popen(['git', 'archive', '--format=tar', 'HEAD'],
+                       cwd=source_dir, stdout=sp.PIPE)
     try:
-        os.chdir(source_dir)
-        sp.check_call(['git', 'archive', '-o', source_archive, 'HEAD'],
-                      shell=True)
+        with tarfile.open(fileobj=process.stdout, mode='r|') as tar:
+            for member_i in tar:
+                if _skip_member(member_i):
+                    continue
+                tar.extract(member_i, target_dir)
     finally:
-        os.chdir(original_dir)
-
-    # Extract exported git archive to Conda MicroDrop plugins directory.
-    with zipfile.ZipFile(source_archive, 'r') as zip_ref:
-        zip_ref.extractall(target_dir)
-    # Extraction is complete.  Remove temporary archive.
-    source_archive.remove()
-
-    # Delete Conda build recipe from installed package.
-    target_dir.joinpath('.conda-recipe').rmtree()
-    # Delete Conda build recipe from installed package.
-    for p in target_dir.files('.git*'):
-        p.remove()
+        process.stdout.close()
+        returncode = process.wait()
+    if returncode != 0:
+        raise sp.CalledProcessError(returncode, 'git archive')
 
     # Write package information to (legacy) `properties.yml` file.
-    original_dir = ph.path(os.getcwd())
-    try:
-        os.chdir(source_dir)
-        if version_number is None:
-            # Assume versioneer is being used for managing version.
-            import _version as v
-
-            version_info = {'version': v.get_versions()['version'],
-                            'versioneer': v.get_versions()}
-        else:
-            # Version number was specified explicitly.
-            version_info = {'version': version_number}
-    finally:
-        os.chdir(original_dir)
+    if version_number is None:
+        # Assume versioneer is being used for managing version.
+        #
+        # Load `_version.py` from source directory by path (i.e., without
+        # changing the working directory of the process).
+        spec = importlib.util.spec_from_file_location('_version',
+                                                      source_dir
+                                                      .joinpath('_version.py'))
+        v = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(v)
+
+        # Note: `get_versions()` may run `git` to describe the source tree, so
+        # only call it once.
+        versions = v.get_versions()
+        version_info = {'version': versions['version'],
+                        'versioneer': versions}
+    else:
+        # Version number was specified explicitly.
+        version_info = {'version': version_number}
 
     # Create properties dictionary object (cast types, e.g., `ph.path`, to
     # strings for cleaner YAML dump).
@@ -140,11 +201,15 @@ def build(source_dir, target_dir, package_name=None, version_number=None):
                   'plugin_name': str(target_dir.name)}
     properties.update(version_info)
 
+    # Dump properties to YAML-formatted string.
+    # Setting `default_flow_style=False` writes each property on a separate
+    # line (cosmetic change only).
+    properties_text = yaml.dump(properties, Dumper=Dumper,
+                                default_flow_style=False)
+
+    # Write complete YAML document to file in a single call.
     with target_dir.joinpath('properties.yml').open('w') as properties_yml:
-        # Dump properties to YAML-formatted file.
-        # Setting `default_flow_style=False` writes each property on a separate
-        # line (cosmetic change only).
-        yaml.dump(properties, properties_yml, default_flow_style=False)
+        properties_yml.write(properties_text)
 
 
 def main(args=None):
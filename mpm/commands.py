@@ -9,6 +9,7 @@ Inspired by `pip`.
     mpm uninstall <plugin-name>
     mpm freeze
 '''
+import functools
 import io as StringIO
 import logging
 import os
@@ -16,8 +17,6 @@ import tempfile as tmp
 
 from path_helpers import path
 import configobj
-import progressbar
-import requests
 import tarfile
 import yaml
 
@@ -28,6 +27,21 @@ DEFAULT_INDEX_HOST = r'http://microfluidics.utoronto.ca/update'
 SERVER_URL_TEMPLATE = r'%s/plugins/{}/json/'
 DEFAULT_SERVER_URL = SERVER_URL_TEMPLATE % DEFAULT_INDEX_HOST
 
+
+@functools.lru_cache(maxsize=1)
+def _session():
+    '''
+    Returns
+    -------
+    requests.Session
+        HTTP session shared by plugin downloads, i.e., reuse connection to
+        index server when installing multiple plugins.
+    '''
+    import requests
+
+    return requests.Session()
+
+
 def home_dir():
     '''
     Returns:
@@ -215,15 +229,22 @@ def install(plugin_package, plugins_directory, server_url=DEFAULT_SERVER_URL):
 
     if not plugin_is_file:
         # Download plugin release archive.
-        download = requests.get(release['url'], stream=True)
+        import progressbar
+
+        download = _session().get(release['url'], stream=True)
 
-        plugin_archive_bytes = StringIO.StringIO()
+        plugin_archive_bytes = StringIO.BytesIO()
         total_bytes = int(download.headers['Content-length'])
         bytes_read = 0
 
         with progressbar.ProgressBar(max_value=total_bytes) as bar:
             while bytes_read < total_bytes:
-                chunk_i = download.raw.read(1 << 8)
+                chunk_i = download.raw.read(min(1 << 16,
+                                                total_bytes - bytes_read))
+                if not chunk_i:
+                    raise IOError('Download of `{}` ended after {} of {} '
+                                  'bytes.'.format(release['url'], bytes_read,
+                                                  total_bytes))
                 bytes_read += len(chunk_i)
                 plugin_archive_bytes.write(chunk_i)
                 bar.update(bytes_read)
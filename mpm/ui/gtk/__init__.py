@@ -1,21 +1,112 @@
+from concurrent.futures import Future
+import functools
 import logging
 import threading
-import types
 
 import conda_helpers as ch
-import gtk
-import gobject
 import logging_helpers as lh
 
 from ...api import installed_plugins, update
 
 logger = logging.getLogger(__name__)
 
-# The `update_plugin_dialog` class uses threads.  Need to initialize GTK to use
-# threads. See [here][1] for more information.
-#
-# [1]: http://faq.pygtk.org/index.py?req=show&file=faq20.001.htp
-gtk.gdk.threads_init()
+# Update dialog message markup.
+_SEARCHING_ALL_MESSAGE = 'Searching for updates for all installed plugins...'
+_SEARCHING_ONE_TEMPLATE = 'Searching for updates for <tt>{}</tt>...'
+_SEARCHING_TEMPLATE = 'Searching for updates for:\n<tt>{}</tt>'
+_UPDATED_TEMPLATE = ('The following plugin(s) were updated successfully:\n'
+                     '<b><tt>{}</tt></b>')
+_DEPENDENCIES_UPDATED_MESSAGE = ('Plugin dependencies were updated '
+                                 'successfully.')
+_ALREADY_INSTALLED_TEMPLATE = ('The latest version of the following plugin(s) '
+                               'are already installed: <tt><b>`{}`</b></tt>')
+_ERROR_TEMPLATE = 'Error updating plugin(s):\n<tt>{}</tt>'
+_UNINSTALLED_TEMPLATE = '<b>Uninstalled:</b>\n<tt>\n{}\n</tt>'
+_INSTALLED_TEMPLATE = '<b>Installed:</b>\n<tt>\n{}\n</tt>'
+# Format of each line in list of uninstalled/installed packages, from
+# `(package, channel)` tuple.
+_VERSION_LINE_TEMPLATE = ' - {} (from {})'
+
+# Interval between progress bar pulses (~30 frames per second).
+_PULSE_INTERVAL_MS = 1000 // 30
+
+
+@functools.lru_cache(maxsize=1)
+def _gtk_modules():
+    '''
+    Import and initialize GTK on first use (i.e., not when this module is
+    imported).
+
+    .. versionadded:: 0.26
+
+    Returns
+    -------
+    tuple
+        ``(gtk, gobject)`` modules.
+    '''
+    import gtk
+    import gobject
+
+    # The `update_plugin_dialog` class uses threads.  Need to initialize GTK to
+    # use threads. See [here][1] for more information.
+    #
+    # [1]: http://faq.pygtk.org/index.py?req=show&file=faq20.001.htp
+    gtk.gdk.threads_init()
+    return gtk, gobject
+
+
+def _installed_package_names(package_name, ignore_not_installed=True):
+    '''
+    .. versionadded:: 0.26
+
+    Parameters
+    ----------
+    package_name : list or None
+        Conda MicroDrop plugin package names.
+
+        If ``None``, look up all plugins installed as Conda packages.
+    ignore_not_installed : bool, optional
+        If ``True`` (*default*), ignore plugin packages that are not installed
+        as Conda packages.
+
+    Returns
+    -------
+    list
+        Names of specified plugin packages that are installed as Conda
+        packages.
+
+    Raises
+    ------
+    conda_helpers.PackageNotFound
+        If :data:`ignore_not_installed` is ``False`` and at least one plugin
+        is not installed as a Conda package.
+    '''
+    if package_name is None:
+        # No plugin package specified.  Update all plugins which are installed
+        # as Conda packages.
+        logger.info('Update all plugins installed as Conda packages.')
+        return [plugin_i['package_name'] for plugin_i in
+                installed_plugins(only_conda=True, fields=('package_name', ))]
+
+    # Only update plugins that are installed as Conda packages.
+    try:
+        conda_package_infos = ch.package_version(package_name, verbose=False)
+    except ch.PackageNotFound as exception:
+        # At least one specified plugin package name did not correspond to an
+        # installed Conda package.
+        if not ignore_not_installed:
+            # Raise error indicating at least one plugin is not installed as a
+            # Conda package.
+            raise
+        logger.warning(str(exception))
+        conda_package_infos = exception.available
+    # Extract name from each Conda plugin package.
+    package_name = [package_i['name'] for package_i in conda_package_infos]
+    if logger.isEnabledFor(logging.INFO):
+        logger.info('Update the following plugins: %s',
+                    ', '.join('`{}`'.format(name_i)
+                              for name_i in package_name))
+    return package_name
 
 
 def update_plugin_dialog(package_name=None, update_args=None,
@@ -47,6 +138,22 @@ def update_plugin_dialog(package_name=None, update_args=None,
         Fix bug in status message markup syntax when no packages are unlinked
         **or** linked.
 
+    .. versionchanged:: 0.26
+        Pulse progress bar using a GLib timeout source, rather than a
+        dedicated thread.
+
+        Import and initialize GTK on first call, rather than on import.
+
+        Show Conda progress messages (e.g., package downloads) in progress
+        bar.
+
+        Pulse progress bar at ~30 Hz.
+
+        Look up installed plugin packages in update thread, i.e., show dialog
+        before querying Conda.  A :class:`conda_helpers.PackageNotFound`
+        exception (see :data:`ignore_not_installed`) is raised once the dialog
+        is closed.
+
     Parameters
     ----------
     package_name : str or list, optional
@@ -76,48 +183,97 @@ def update_plugin_dialog(package_name=None, update_args=None,
 
     Notes
     -----
-    This function launches two threads; one to pulse the progress bar
-    periodically, and one to run the actual update attempt.
+    This function launches a thread to run the actual update attempt.  The
+    progress bar is pulsed periodically from the GTK main loop.
+
+    See also
+    --------
+    update_plugin_dialog_async
     '''
-    thread_context = {}
+    return _update_plugin_dialog(package_name, update_args, update_kwargs,
+                                 ignore_not_installed, blocking=True)
 
-    if package_name is None:
-        # No plugin package specified.  Update all plugins which are installed
-        # as Conda packages.
-        installed_plugins_ = installed_plugins(only_conda=True)
-        installed_package_names = [plugin_i['package_name']
-                                   for plugin_i in installed_plugins_]
-        package_name = installed_package_names
-        logger.info('Update all plugins installed as Conda packages.')
-    else:
-        # At least one plugin package name was explicitly specified.
-        if isinstance(package_name, (str,)):
-            package_name = [package_name]
 
-        # Only update plugins that are installed as Conda packages.
-        try:
-            conda_package_infos = ch.package_version(package_name, verbose=False)
-        except ch.PackageNotFound as exception:
-            # At least one specified plugin package name did not correspond to an
-            # installed Conda package.
-            if not ignore_not_installed:
-                # Raise error indicating at least one plugin is not installed
-                # as a Conda package.
-                raise
-            logger.warning(str(exception))
-            conda_package_infos = exception.available
-        # Extract name from each Conda plugin package.
-        package_name = [package_i['name'] for package_i in conda_package_infos]
-        logger.info('Update the following plugins: %s',
-                    ', '.join('`{}`'.format(name_i)
-                              for name_i in package_name))
+def update_plugin_dialog_async(package_name=None, update_args=None,
+                               update_kwargs=None, ignore_not_installed=True):
+    '''
+    Launch dialog to track status of update of specified plugin package,
+    **without** blocking until the dialog is closed.
 
-    # Format string list of packages.
-    package_name_list = ', '.join('`{}`'.format(name_i)
-                                  for name_i in package_name)
-    # Format multiple-lines string list of packages.
-    package_name_lines = '\n'.join(' - {}'.format(name_i)
-                                   for name_i in package_name)
+    .. versionadded:: 0.26
+
+    Parameters
+    ----------
+    package_name : str or list, optional
+        See :func:`update_plugin_dialog`.
+    update_args : list or tuple, optional
+        See :func:`update_plugin_dialog`.
+    update_kwargs : dict, optional
+        See :func:`update_plugin_dialog`.
+    ignore_not_installed : bool, optional
+        See :func:`update_plugin_dialog`.
+
+    Returns
+    -------
+    concurrent.futures.Future
+        Resolved (from the GTK main loop) once the dialog is closed, with
+        either the Conda install log, or ``None`` if the update failed or the
+        dialog was cancelled.
+
+    Notes
+    -----
+    The GTK main loop must be running (e.g., :func:`gtk.main`) for the dialog
+    to be displayed and for the returned future to be resolved.
+    '''
+    return _update_plugin_dialog(package_name, update_args, update_kwargs,
+                                 ignore_not_installed, blocking=False)
+
+
+def _update_plugin_dialog(package_name, update_args, update_kwargs,
+                          ignore_not_installed, blocking=True):
+    '''
+    .. versionadded:: 0.26
+
+    Parameters
+    ----------
+    blocking : bool, optional
+        If ``True``, run dialog (i.e., block until closed) and return result.
+        Otherwise, show dialog and return future result.
+
+    See also
+    --------
+    update_plugin_dialog, update_plugin_dialog_async
+    '''
+    gtk, gobject = _gtk_modules()
+    thread_context = {}
+
+    if isinstance(package_name, str):
+        package_name = [package_name]
+
+    def _format_names(package_name):
+        '''
+        Returns
+        -------
+        tuple
+            Searching message, string list of packages, and multiple-lines
+            string list of packages (markup escaped).
+        '''
+        # Escape each package name for markup once, for use in all messages.
+        escaped_names = [gobject.markup_escape_text(name_i)
+                         for name_i in package_name or []]
+        package_name_list = ', '.join('`{}`'.format(name_i)
+                                      for name_i in escaped_names)
+        package_name_lines = '\n'.join(' - {}'.format(name_i)
+                                       for name_i in escaped_names)
+        if package_name is None:
+            searching_text = _SEARCHING_ALL_MESSAGE
+        elif len(escaped_names) == 1:
+            # A single package was specified.
+            searching_text = _SEARCHING_ONE_TEMPLATE.format(escaped_names[0])
+        else:
+            # Multiple packages were specified.
+            searching_text = _SEARCHING_TEMPLATE.format(package_name_lines)
+        return searching_text, package_name_list, package_name_lines
 
     def _update(update_complete, package_name):
         '''
@@ -131,16 +287,38 @@ def update_plugin_dialog(package_name=None, update_args=None,
             Conda MicroDrop plugin package name(s) (default to all installed
             plugins).
         '''
+        _, package_name_list, package_name_lines = _format_names(package_name)
         try:
+            # Look up installed plugin packages here (i.e., in the update
+            # thread), since querying Conda may take several seconds.
+            try:
+                package_name = _installed_package_names(package_name,
+                                                        ignore_not_installed)
+            except ch.PackageNotFound as exception:
+                # Re-raise once dialog is closed.
+                thread_context['exception'] = exception
+                raise
+            (searching_text, package_name_list,
+             package_name_lines) = _format_names(package_name)
+
+            def _searching():
+                dialog.set_properties(text=searching_text, use_markup=True)
+            gobject.idle_add(_searching, priority=gobject.PRIORITY_HIGH_IDLE)
+
             with lh.logging_restore(clear_handlers=True):
                 args = update_args or []
-                kwargs = update_kwargs or {}
+                kwargs = dict(update_kwargs or {})
                 kwargs['package_name'] = package_name
+                kwargs['progress_callback'] = _progress
                 # Pass extra args and kwargs to `.api.update` (if specified).
                 update_response = update(*args, **kwargs)
                 thread_context['update_response'] = update_response
 
             # Display prompt indicating update status.
+            #
+            # Note: status message markup is formatted here in the update
+            # thread, so that only widget properties are set from the GTK
+            # main thread.
 
             # Get list of unlinked and linked packages.
             install_info_ = ch.install_info(update_response)
@@ -148,89 +326,111 @@ def update_plugin_dialog(package_name=None, update_args=None,
             if any(install_info_):
                 # At least one package was uninstalled or installed (or
                 # "unlinked"/"linked" in Conda lingo).
+                #
+                # Names of linked packages, e.g., `foo` from `foo-1.0-py_0`
+                # (or `foo 1.0`).
+                linked_names = set()
+                for linked_i in install_info_[1]:
+                    linked_names.add(linked_i[0].rsplit('-', 2)[0])
+                    linked_names.add(linked_i[0].split(' ', 1)[0])
+                # Plugin packages that were updated.
+                updated_packages = [package_name_i
+                                    for package_name_i in package_name
+                                    if package_name_i in linked_names]
+
+                detailed_messages = []
+                for template_i, package_infos_i in zip((_UNINSTALLED_TEMPLATE,
+                                                        _INSTALLED_TEMPLATE),
+                                                       install_info_):
+                    if package_infos_i:
+                        detailed_messages.append(template_i.format(
+                            '\n'.join(_VERSION_LINE_TEMPLATE.format(*info_j)
+                                      for info_j in package_infos_i)))
+                secondary_text = '\n'.join(detailed_messages)
+
+                if updated_packages:
+                    message = _UPDATED_TEMPLATE.format(package_name_lines)
+                else:
+                    message = _DEPENDENCIES_UPDATED_MESSAGE
+
                 def _status():
-                    updated_packages = []
-                    for package_name_i in package_name:
-                        if any(linked_i[0].startswith(package_name_i)
-                               for linked_i in install_info_[1]):
-                            # Plugin package was updated.
-                            updated_packages.append(package_name_i)
-
-                    def _version_lines(package_info_tuples):
-                        return (['<tt>'] + list(' - {} (from {})'
-                                                .format(name_i, channel_i)
-                                                for name_i, channel_i in
-                                                package_info_tuples) +
-                                ['</tt>'])
-                    detailed_message_lines = []
-                    if install_info_[0]:
-                        detailed_message_lines.append('<b>Uninstalled:</b>')
-                        (detailed_message_lines
-                         .extend(_version_lines(install_info_[0])))
-                    if install_info_[1]:
-                        detailed_message_lines.append('<b>Installed:</b>')
-                        (detailed_message_lines
-                         .extend(_version_lines(install_info_[1])))
-
-                    dialog.props.secondary_text = \
-                        '\n'.join(detailed_message_lines)
-                    dialog.props.secondary_use_markup = True
-                    dialog.props.use_markup = True
-
-                    if updated_packages:
-                        message = ('The following plugin(s) were updated '
-                                   'successfully:\n<b><tt>{}</tt></b>'
-                                   .format(package_name_lines))
-                    else:
-                        message = ('Plugin dependencies were updated '
-                                   'successfully.')
-                    dialog.props.text = message
+                    dialog.set_properties(text=message, use_markup=True,
+                                          secondary_text=secondary_text,
+                                          secondary_use_markup=True)
             else:
                 # No packages were unlinked **or** linked.
+                #
+                #  1. Success (with previous version and new version).
+                message = _ALREADY_INSTALLED_TEMPLATE.format(package_name_list)
+
                 def _status():
-                    #  1. Success (with previous version and new version).
-                    dialog.props.text = ('The latest version of the following '
-                                         'plugin(s) are already installed: '
-                                         '<tt><b>`{}`</b></tt>'
-                                         .format(package_name_list))
-                    dialog.props.use_markup = True
-            gobject.idle_add(_status)
+                    dialog.set_properties(text=message, use_markup=True)
+            _show_result = _status
         except Exception as exception:
             # Failure updating plugin.
+            message = _ERROR_TEMPLATE.format(package_name_lines)
+            # Unescape newlines (e.g., in Conda JSON error output) *before*
+            # escaping markup, i.e., only escape the resulting text once.
+            exception_markup = gobject.markup_escape_text(str(exception)
+                                                          .replace(r'\n',
+                                                                   '\n'))
+
             def _error():
-                dialog.props.text = ('Error updating plugin(s):\n<tt>{}</tt>'
-                                     .format(package_name_lines))
-                dialog.props.use_markup = True
-                exception_markup = gobject.markup_escape_text(str(exception))
-                exception_markup = exception_markup.replace(r'\n', '\n')
-
-                content_area = dialog.get_content_area()
-                label = gtk.Label()
-                label.set_markup(exception_markup)
-                error_scroll = gtk.ScrolledWindow()
-                error_scroll.set_policy(gtk.POLICY_AUTOMATIC,
-                                        gtk.POLICY_AUTOMATIC)
-                error_scroll.add_with_viewport(label)
-                error_scroll.show_all()
+                dialog.set_properties(text=message, use_markup=True)
 
-                content_area.pack_start(error_scroll, expand=True, fill=True)
-            gobject.idle_add(_error)
+                error_label.set_markup(exception_markup)
+                error_scroll.show_all()
+            _show_result = _error
             thread_context['update_response'] = None
         update_complete.set()
 
-    def _pulse(update_complete, progress_bar):
-        '''
-        Show pulsing progress bar to indicate activity.
-        '''
-        while not update_complete.wait(1. / 16):
-            gobject.idle_add(progress_bar.pulse)
         def _on_complete():
+            # Apply all final dialog changes in a single main loop callback
+            # (i.e., not interleaved with progress bar pulses).
+            _show_result()
             progress_bar.set_fraction(1.)
             progress_bar.hide()
             # Enable "OK" button and focus it.
-            dialog.action_area.get_children()[1].props.sensitive = True
-            dialog.action_area.get_children()[1].grab_focus()
-        gobject.idle_add(_on_complete)
+            ok_button.props.sensitive = True
+            ok_button.grab_focus()
+        gobject.idle_add(_on_complete, priority=gobject.PRIORITY_HIGH_IDLE)
+
+    def _progress(fraction, message):
+        '''
+        Show Conda progress (e.g., package download) in progress bar.
+
+        Called from update thread.  Only update progress bar if progress has
+        changed by at least 1%.
+        '''
+        previous = progress_state['fraction']
+        if previous is not None and abs(fraction - previous) < .01:
+            return
+        progress_state['fraction'] = fraction
+
+        def _show_progress():
+            progress_bar.set_fraction(fraction)
+            progress_bar.set_text(message)
+        gobject.idle_add(_show_progress)
+
+    def _pulse():
+        '''
+        Show pulsing progress bar to indicate activity.
+
+        Returns
+        -------
+        bool
+            ``True`` to continue pulsing until update has completed or Conda
+            has reported progress (i.e., keep GLib timeout source active).
+        '''
+        if (update_complete.is_set() or
+                progress_state['fraction'] is not None):
+            progress_state['pulsing'] = False
+            return False
+        if progress_bar.is_drawable():
+            # Only pulse if progress bar is visible (e.g., skip while dialog
+            # is minimized).
+            progress_bar.pulse()
+        return True
 
     dialog = gtk.MessageDialog(buttons=gtk.BUTTONS_OK_CANCEL)
     dialog.set_position(gtk.WIN_POS_MOUSE)
@@ -239,39 +439,66 @@ def update_plugin_dialog(package_name=None, update_args=None,
     content_area = dialog.get_content_area()
     content_area.pack_start(progress_bar, True, True, 5)
     content_area.show_all()
+    # Scrollable error message area (hidden unless update fails).
+    error_label = gtk.Label()
+    error_scroll = gtk.ScrolledWindow()
+    error_scroll.set_policy(gtk.POLICY_AUTOMATIC, gtk.POLICY_AUTOMATIC)
+    error_scroll.add_with_viewport(error_label)
+    content_area.pack_start(error_scroll, expand=True, fill=True)
     # Disable "OK" button until update has completed.
-    dialog.action_area.get_children()[1].props.sensitive = False
+    ok_button = dialog.get_widget_for_response(gtk.RESPONSE_OK)
+    ok_button.props.sensitive = False
 
     dialog.props.title = 'Update plugin'
-    if len(package_name) > 1:
-        # Multiple packages were specified.
-        dialog.props.text = ('Searching for updates for:\n<tt>{}</tt>'
-                             .format(package_name_lines))
-    else:
-        # A single package was specified.
-        dialog.props.text = ('Searching for updates for <tt>{}</tt>...'
-                             .format(package_name[0]))
+    dialog.props.text = _format_names(package_name)[0]
     dialog.props.use_markup = True
 
     # Event to keep progress bar pulsing while waiting for update to
     # complete.
     update_complete = threading.Event()
 
-    # Launch thread to periodically pulse progress bar.
-    progress_thread = threading.Thread(target=_pulse, args=(update_complete,
-                                                            progress_bar, ))
-    progress_thread.daemon = True
-    progress_thread.start()
+    # Latest progress reported by Conda (if any).
+    progress_state = {'fraction': None, 'pulsing': True}
+
+    # Periodically pulse progress bar from the GTK main loop (i.e., without a
+    # dedicated thread) until Conda reports progress.
+    pulse_id = gobject.timeout_add(_PULSE_INTERVAL_MS, _pulse)
 
     # Launch thread to attempt plugin update.
     update_thread = threading.Thread(target=_update, args=(update_complete,
                                                            package_name, ))
+    # Do not wait for (e.g., cancelled) update to finish on exit.
     update_thread.daemon = True
     update_thread.start()
 
-    # Show dialog.
-    dialog.run()
-    dialog.destroy()
+    def _close():
+        if progress_state['pulsing']:
+            # Dialog was closed before update completed.  Stop pulsing.
+            gobject.source_remove(pulse_id)
+        dialog.destroy()
+
+        if 'exception' in thread_context:
+            # At least one plugin is not installed as a Conda package (and
+            # `ignore_not_installed` is `False`).
+            raise thread_context['exception']
+
+        # Return response from `conda_helpers.api.update` call.
+        return thread_context.get('update_response')
+
+    if blocking:
+        # Show dialog.
+        dialog.run()
+        return _close()
+
+    future = Future()
+
+    def _on_response(dialog, response_id):
+        try:
+            future.set_result(_close())
+        except Exception as exception:
+            future.set_exception(exception)
 
-    # Return response from `conda_helpers.api.update` call.
-    return thread_context.get('update_response')
+    dialog.connect('response', _on_response)
+    # Show dialog (without running a nested main loop).
+    dialog.show()
+    return future
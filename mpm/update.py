@@ -1,18 +1,162 @@
+import functools
+import logging
+import os
+
 import conda_helpers as ch
 
-from .api import install as plugin_install
+from .api import _conda_prefix, available_packages, install as plugin_install
+
+logger = logging.getLogger(__name__)
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_package_version(package_names, conda_meta_mtime):
+    '''
+    .. versionadded:: 0.26
+
+    Parameters
+    ----------
+    package_names : str or tuple
+        Conda package name(s).
+    conda_meta_mtime : int
+        Modified time (in nanoseconds) of ``conda-meta`` directory in Conda
+        environment, i.e., changes whenever packages are linked or unlinked.
+
+    Returns
+    -------
+    dict or list
+        Output of :func:`conda_helpers.package_version`.
+    '''
+    if isinstance(package_names, tuple):
+        package_names = list(package_names)
+    return ch.package_version(package_names)
+
+
+def _package_version(package_names):
+    '''
+    Look up installed version(s) of Conda package(s).
+
+    Results are cached until the Conda environment is modified.
+
+    .. versionadded:: 0.26
+
+    Parameters
+    ----------
+    package_names : str or list
+        Conda package name(s).
 
+    Returns
+    -------
+    dict or list
+        Output of :func:`conda_helpers.package_version`.
+    '''
+    if not isinstance(package_names, str):
+        package_names = tuple(package_names)
+    conda_meta_mtime = os.stat(_conda_prefix()
+                               .joinpath('conda-meta')).st_mtime_ns
+    return _cached_package_version(package_names, conda_meta_mtime)
 
-def _update_plugin(package_name):
+
+def _install(package_name, progress_callback=None):
+    '''
+    Install latest version of plugin package(s).
+
+    .. versionadded:: 0.26
+
+    Parameters
+    ----------
+    package_name : str or list
+        Conda MicroDrop plugin package name(s).
+    progress_callback : callable, optional
+        Called with ``(fraction, message)`` for each Conda progress message
+        (see :func:`mpm.api.install`).
+
+    Returns
+    -------
+    dict
+        Conda installation log object (see :func:`mpm.api.install`).
+
+    Raises
+    ------
+    IOError
+        If Conda update server cannot be reached, e.g., if there is no network
+        connection available.
+    '''
+    try:
+        return plugin_install(package_name,
+                              progress_callback=progress_callback)
+    except RuntimeError as exception:
+        if 'CondaHTTPError' in str(exception):
+            raise IOError('Error accessing update server.')
+        else:
+            raise
+
+
+def _latest_installed(package_name):
+    '''
+    .. versionadded:: 0.26
+
+    Parameters
+    ----------
+    package_name : str
+        Conda MicroDrop plugin package name.
+
+    Returns
+    -------
+    dict or None
+        Installed package info (see :func:`conda_helpers.package_version`) if
+        the installed version matches the latest version available from the
+        configured Conda channels.
+
+        ``None`` if a newer version (or build) *may* be available, or if
+        either version could not be determined.
+    '''
+    try:
+        from conda.models.version import VersionOrder
+
+        version_dict = _package_version(package_name)
+        # Always search the plugin channel(s), i.e., never trust cached search
+        # results to decide whether to skip the Conda solver (see
+        # `available_packages()`).  Note that searching is still much cheaper
+        # than solving.
+        packages = available_packages(refresh=True)
+        available_versions = (packages or {}).get(package_name)
+        if not available_versions:
+            return None
+        # Records are **not** guaranteed to be sorted (e.g., records from
+        # multiple channels/subdirs), so compare by version *and* build
+        # number across all records.
+        latest = max((VersionOrder(version_i['version']),
+                      version_i['build_number'])
+                     for version_i in available_versions)
+        installed = (VersionOrder(version_dict['version']),
+                     version_dict['build_number'])
+    except Exception:
+        logger.debug('Could not compare installed and available versions of '
+                     '`%s`.', package_name, exc_info=True)
+        return None
+    return version_dict if installed >= latest else None
+
+
+def _update_plugin(package_name, progress_callback=None):
     '''
     Update plugin (no user interface).
 
     .. versionadded:: 0.19
 
+    .. versionchanged:: 0.26
+        Skip Conda install if the latest available version is already
+        installed.
+
     Parameters
     ----------
     package_name : str, optional
         Conda MicroDrop plugin package name, e.g., `microdrop.mr-box-plugin`.
+    progress_callback : callable, optional
+        Called with ``(fraction, message)`` for each Conda progress message
+        (see :func:`mpm.api.install`).
+
+        .. versionadded:: 0.26
 
     Returns
     -------
@@ -34,24 +178,30 @@ def _update_plugin(package_name):
     --------
     _update_plugin_ui
     '''
-    try:
-        update_json_log = plugin_install(package_name)
-    except RuntimeError as exception:
-        if 'CondaHTTPError' in str(exception):
-            raise IOError('Error accessing update server.')
-        else:
-            raise
+    version_dict = _latest_installed(package_name)
+    if version_dict is not None:
+        # Latest available version is already installed, so skip running the
+        # Conda solver.
+        update_json_log = {'success': True,
+                           'message': 'All requested packages already '
+                           'installed.'}
+        update_json_log.update(version_dict)
+        return update_json_log
+
+    update_json_log = _install(package_name,
+                               progress_callback=progress_callback)
 
     if update_json_log.get('success'):
         if 'actions' in update_json_log:
             # Plugin was updated successfully.
             # Display prompt indicating previous version
             # and new version.
+            _cached_package_version.cache_clear()
             actions = update_json_log['actions']
             update_json_log['old_versions'] = actions.get('UNLINK', [])
             update_json_log['new_versions'] = actions.get('LINK', [])
         else:
             # No update available.
-            version_dict = ch.package_version(package_name)
+            version_dict = _package_version(package_name)
             update_json_log.update(version_dict)
         return update_json_log
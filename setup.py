@@ -1,16 +1,23 @@
-import platform
-import sys
+import importlib.util
+import os
 
 import setuptools as st
-sys.path.insert(0, '.')
-import version
 
+# Load `version.py` next to this file by path (i.e., without modifying
+# `sys.path`, which may shadow other modules named `version`, e.g., from
+# `pywin32`).
+_version_spec = importlib.util.spec_from_file_location(
+    'version', os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                            'version.py'))
+version = importlib.util.module_from_spec(_version_spec)
+_version_spec.loader.exec_module(version)
 
-install_requires = ['configobj', 'path-helpers', 'pip-helpers>=0.6',
-                    'progressbar2', 'pyyaml', 'si-prefix>=0.4.post3']
 
-if platform.system() == 'Windows':
-    install_requires += ['pywin32']
+# Use environment marker for Windows-only dependency, so that the requirement
+# is evaluated on the installing system (not the building system).
+install_requires = ['configobj', 'path-helpers', 'pip-helpers>=0.6',
+                    'progressbar2', 'pyyaml', 'si-prefix>=0.4.post3',
+                    'pywin32; sys_platform == "win32"']
 
 st.setup(name='microdrop-plugin-manager',
          version=version.getVersion(),
@@ -21,6 +28,8 @@ st.setup(name='microdrop-plugin-manager',
          url='https://github.com/wheeler-microfluidics/mpm',
          license='BSD',
          packages=['mpm', ],
+         # Module `__getattr__` (PEP 562) requires Python 3.7+.
+         python_requires='>=3.7',
          install_requires=install_requires,
          # Install data listed in `MANIFEST.in`
          include_package_data=True,
@@ -0,0 +1,54 @@
+import os
+
+import path_helpers as ph
+import pytest
+
+import mpm.api
+
+
+@pytest.fixture
+def prefix(tmp_path, monkeypatch):
+    '''
+    Conda prefix containing one enabled plugin (linked to an available plugin
+    directory) and one broken plugin link (i.e., link target was removed).
+    '''
+    prefix = ph.path(str(tmp_path))
+    monkeypatch.setattr(mpm.api, '_conda_prefix', lambda: prefix)
+    # Paths are cached per process, so resolve them against temporary prefix.
+    mpm.api._conda_path.cache_clear()
+
+    available_dir = mpm.api._conda_path('MICRODROP_PLUGINS_AVAILABLE')
+    enabled_dir = mpm.api._conda_path('MICRODROP_PLUGINS_ENABLED')
+    for name_i in ('foo', 'bar'):
+        os.makedirs(available_dir.joinpath(name_i))
+        with open(available_dir.joinpath(name_i, 'properties.yml'),
+                  'w') as output:
+            output.write('package_name: microdrop.{}\n'.format(name_i))
+    os.makedirs(enabled_dir)
+    try:
+        for name_i in ('foo', 'bar'):
+            os.symlink(available_dir.joinpath(name_i),
+                       enabled_dir.joinpath(name_i), target_is_directory=True)
+    except (NotImplementedError, OSError):
+        pytest.skip('Creating directory links is not supported.')
+    # Remove target of `bar` link, leaving a dangling link.
+    available_dir.joinpath('bar').rmtree()
+    yield prefix
+    mpm.api._conda_path.cache_clear()
+
+
+def test_remove_broken_links(prefix):
+    enabled_dir = mpm.api._conda_path('MICRODROP_PLUGINS_ENABLED')
+
+    removed = mpm.api._remove_broken_links()
+
+    assert removed == [enabled_dir.joinpath('bar')]
+    assert not os.path.lexists(enabled_dir.joinpath('bar'))
+    assert os.path.isdir(enabled_dir.joinpath('foo'))
+
+
+def test_enabled_plugins_skips_broken_links(prefix):
+    plugins = mpm.api.enabled_plugins(installed_only=False)
+
+    assert [plugin_i['package_name'] for plugin_i in plugins] == \
+        ['microdrop.foo']